@@ -1,7 +1,8 @@
 # algorithm_comparison.py
 import pygame
-import copy
+import threading
 import time
+from collections import OrderedDict
 from config import (
     MODE_DFS,
     MODE_BFS,
@@ -9,6 +10,7 @@ from config import (
     MODE_A1,
     MODE_A2,
     MODE_ACO,
+    MODE_UCS_HEAP,
     BLACK,
     WHITE,
     BACKGROUND_COLOR,
@@ -16,277 +18,49 @@ from config import (
     TEXT_FONT,
     BUTTON_FONT,
     SMALL_FONT,
+    IDLE_WAIT_MS,
+    get_font,
 )
 
-from maze import backtrack
-from stats import AlgorithmStats, calculate_path_length
-from ui_components import draw_button, draw_scrollbar
+from game import run_search
+from maze import (
+    make_rng,
+    new_parents,
+    new_search_map,
+    clear_parents,
+    clear_search_map,
+)
+from stats import AlgorithmStats
+from ui_components import (
+    draw_button,
+    draw_scrollbar,
+    vertical_gradient,
+    bar_gradient,
+    render_text,
+)
+from minimap import MINIMAP_SIZE
 
 
-def run_algorithm_with_stats(game, algorithm_name, mode):
-    """Run an algorithm and collect statistics"""
-    # Create deep copies to avoid modifying the original maze
-    cell_map = copy.deepcopy(game.cell_map)
-    search_map = [
-        {"searched": False, "inSolution": False} for _ in range(game.rows * game.cols)
-    ]
-    paths_searched = []
+def run_algorithm_with_stats(game, algorithm_name, mode, search_map=None, parents=None):
+    """Run an algorithm and collect statistics
 
-    # Create and initialize stats object
-    stats = AlgorithmStats(algorithm_name)
-    stats.start_timer()
-
-    # Use direct implementation instead of relying on algorithm generators
-    cells_explored = 0
-    max_frontier_size = 0
+    search_map and parents can be passed in to reuse them across runs; they
+    are cleared here before the search starts, or replaced if the maze has
+    changed size since.
+    """
+    # Searches only read the maze, so the grid can be shared
+    cell_map = game.cell_map
+    if search_map is None or len(search_map) != len(cell_map):
+        search_map = new_search_map(len(cell_map))
+        parents = new_parents(len(cell_map))
+    else:
+        clear_search_map(search_map)
+        clear_parents(parents)
 
     try:
-        # Run a simplified version of each algorithm for stats collection
-        if mode == MODE_DFS:
-            # Depth-First Search implementation
-            stack = [{"cell": 0, "neighbors": cell_map[0]}]
-            search_map[0]["searched"] = True
-
-            while stack:
-                max_frontier_size = max(max_frontier_size, len(stack))
-                current = stack.pop()
-                cell_idx = current["cell"]
-                cells_explored += 1
-
-                if cell_idx == game.rows * game.cols - 1:  # Reached end
-                    search_map[cell_idx]["inSolution"] = True
-                    backtrack(search_map, paths_searched, cell_idx)
-                    break
-
-                neighbors = current["neighbors"]
-                for direction in ["right", "bottom", "left", "top"]:
-                    n_idx = getattr(neighbors, direction)["neighborIndex"]
-                    if (
-                        n_idx != -1
-                        and getattr(neighbors, direction)["connection"]
-                        and not search_map[n_idx]["searched"]
-                    ):
-                        stack.append({"cell": n_idx, "neighbors": cell_map[n_idx]})
-                        paths_searched.append({"from": cell_idx, "to": n_idx})
-                        search_map[n_idx]["searched"] = True
-
-        elif mode == MODE_BFS:
-            # Breadth-First Search implementation
-            from collections import deque
-
-            queue = deque([{"cell": 0, "neighbors": cell_map[0]}])
-            search_map[0]["searched"] = True
-
-            while queue:
-                max_frontier_size = max(max_frontier_size, len(queue))
-                current = queue.popleft()
-                cell_idx = current["cell"]
-                cells_explored += 1
-
-                if cell_idx == game.rows * game.cols - 1:  # Reached end
-                    search_map[cell_idx]["inSolution"] = True
-                    backtrack(search_map, paths_searched, cell_idx)
-                    break
-
-                neighbors = current["neighbors"]
-                for direction in ["left", "right", "top", "bottom"]:
-                    n_idx = getattr(neighbors, direction)["neighborIndex"]
-                    if (
-                        n_idx != -1
-                        and getattr(neighbors, direction)["connection"]
-                        and not search_map[n_idx]["searched"]
-                    ):
-                        queue.append({"cell": n_idx, "neighbors": cell_map[n_idx]})
-                        paths_searched.append({"from": cell_idx, "to": n_idx})
-                        search_map[n_idx]["searched"] = True
-
-        elif mode == MODE_UCS:
-            # Uniform-Cost Search implementation
-            import heapq
-
-            pq = [(0, 0, {"cell": 0, "neighbors": cell_map[0]})]
-            search_map[0]["searched"] = True
-            cost_so_far = {0: 0}
-
-            while pq:
-                max_frontier_size = max(max_frontier_size, len(pq))
-                current_cost, _, current = heapq.heappop(pq)
-                cell_idx = current["cell"]
-                cells_explored += 1
-
-                if cell_idx == game.rows * game.cols - 1:  # Reached end
-                    search_map[cell_idx]["inSolution"] = True
-                    backtrack(search_map, paths_searched, cell_idx)
-                    break
-
-                neighbors = current["neighbors"]
-                for direction in ["left", "right", "top", "bottom"]:
-                    n_idx = getattr(neighbors, direction)["neighborIndex"]
-                    if n_idx != -1 and getattr(neighbors, direction)["connection"]:
-                        new_cost = current_cost + 1
-
-                        if n_idx not in cost_so_far or new_cost < cost_so_far[n_idx]:
-                            cost_so_far[n_idx] = new_cost
-                            heapq.heappush(
-                                pq,
-                                (
-                                    new_cost,
-                                    n_idx,
-                                    {"cell": n_idx, "neighbors": cell_map[n_idx]},
-                                ),
-                            )
-
-                            if not search_map[n_idx]["searched"]:
-                                paths_searched.append({"from": cell_idx, "to": n_idx})
-                                search_map[n_idx]["searched"] = True
-
-        elif mode == MODE_A1 or mode == MODE_A2:
-            # A* Search implementation
-            choice = 1 if mode == MODE_A1 else 2
-
-            # Create Manhattan distance map
-            manhattan_map = []
-            for r in range(game.rows):
-                for c in range(game.cols):
-                    cost_to_exit = (game.rows - 1 - r) + (game.cols - 1 - c)
-                    manhattan_map.append(
-                        {"costToArrive": -1, "costToExit": cost_to_exit}
-                    )
-            manhattan_map[0]["costToArrive"] = 0
-
-            open_list = [{"cell": 0, "neighbors": cell_map[0]}]
-            search_map[0]["searched"] = True
-
-            while open_list:
-                max_frontier_size = max(max_frontier_size, len(open_list))
-
-                # Find node with lowest f-cost
-                smallest_cost = float("inf")
-                smallest_i = 0
-                for i, item in enumerate(open_list):
-                    idx = item["cell"]
-                    if choice == 1:
-                        cost = (
-                            manhattan_map[idx]["costToArrive"]
-                            + manhattan_map[idx]["costToExit"]
-                        )
-                    else:
-                        cost = manhattan_map[idx]["costToExit"]
-                    if cost < smallest_cost:
-                        smallest_cost = cost
-                        smallest_i = i
-
-                current = open_list.pop(smallest_i)
-                cell_idx = current["cell"]
-                cells_explored += 1
-
-                if cell_idx == game.rows * game.cols - 1:  # Reached end
-                    search_map[cell_idx]["inSolution"] = True
-                    backtrack(search_map, paths_searched, cell_idx)
-                    break
-
-                neighbors = current["neighbors"]
-                for direction in ["left", "right", "top", "bottom"]:
-                    n_idx = getattr(neighbors, direction)["neighborIndex"]
-                    if n_idx != -1 and getattr(neighbors, direction)["connection"]:
-                        current_cost = manhattan_map[cell_idx]["costToArrive"]
-                        neighbor_cost = manhattan_map[n_idx]["costToArrive"]
-                        if neighbor_cost == -1 or neighbor_cost > current_cost + 1:
-                            manhattan_map[n_idx]["costToArrive"] = current_cost + 1
-                            if not search_map[n_idx]["searched"]:
-                                open_list.append(
-                                    {"cell": n_idx, "neighbors": cell_map[n_idx]}
-                                )
-                                paths_searched.append({"from": cell_idx, "to": n_idx})
-                                search_map[n_idx]["searched"] = True
-
-        elif mode == MODE_ACO:
-            # Ant Colony Optimization (simplified)
-            num_ants = 5  # Reduced for speed
-            num_iterations = 3
-
-            exit_idx = game.rows * game.cols - 1
-            exit_row = exit_idx // game.cols
-            exit_col = exit_idx % game.cols
-
-            def get_heuristic(idx):
-                row = idx // game.cols
-                col = idx % game.cols
-                return abs(row - exit_row) + abs(col - exit_col)
-
-            # Initialize pheromone
-            pheromone = {}
-            for i in range(len(cell_map)):
-                neighbors = cell_map[i]
-                for direction in ["left", "right", "top", "bottom"]:
-                    n_idx = getattr(neighbors, direction)["neighborIndex"]
-                    if n_idx != -1 and getattr(neighbors, direction)["connection"]:
-                        pheromone[(i, n_idx)] = 0.1
-
-            best_path = None
-            best_path_length = float("inf")
-
-            # Loop through iterations
-            for _ in range(num_iterations):
-                for _ in range(num_ants):
-                    current_node = 0
-                    path = [current_node]
-                    visited = {0: True}
-
-                    # Ant moves until it reaches exit or gets stuck
-                    while current_node != exit_idx:
-                        cells_explored += 1
-                        neighbors = cell_map[current_node]
-                        possible_moves = []
-
-                        # Find possible moves
-                        for direction in ["left", "right", "top", "bottom"]:
-                            n_idx = getattr(neighbors, direction)["neighborIndex"]
-                            if (
-                                n_idx != -1
-                                and getattr(neighbors, direction)["connection"]
-                                and n_idx not in visited
-                            ):
-                                possible_moves.append(n_idx)
-
-                        if not possible_moves:
-                            # No valid moves, try to backtrack
-                            if len(path) > 1:
-                                path.pop()
-                                current_node = path[-1]
-                                continue
-                            else:
-                                break
-
-                        # Choose next move (simplified)
-                        next_node = min(possible_moves, key=get_heuristic)
-                        path.append(next_node)
-                        visited[next_node] = True
-                        current_node = next_node
-
-                        if not search_map[next_node]["searched"]:
-                            search_map[next_node]["searched"] = True
-                            paths_searched.append({"from": path[-2], "to": next_node})
-
-                    max_frontier_size = max(max_frontier_size, len(visited))
-
-                    # If path found, update best path
-                    if current_node == exit_idx:
-                        path_length = len(path) - 1
-                        if path_length < best_path_length:
-                            best_path = path
-                            best_path_length = path_length
-
-            # Mark solution path if found
-            if best_path:
-                for node in best_path:
-                    search_map[node]["inSolution"] = True
-
-        # Populate stats with collected data
-        stats.cells_explored = cells_explored
-        stats.max_frontier_size = max_frontier_size
-        stats.path_length = calculate_path_length(paths_searched)
-        stats.stop_timer()
+        # Same solvers as the visual searches, with no observer attached
+        stats = run_search(mode, cell_map, search_map, parents, rng=make_rng(game.seed))
+        stats.algorithm_name = algorithm_name
 
         print(f"Algorithm: {stats.algorithm_name}")
         print(f"  Cells explored: {stats.cells_explored}")
@@ -298,26 +72,41 @@ def run_algorithm_with_stats(game, algorithm_name, mode):
 
     except Exception as e:
         print(f"Error running {algorithm_name}: {str(e)}")
-        stats.stop_timer()
-        return stats
+        return AlgorithmStats(algorithm_name)
 
 
-def compare_algorithms(game):
-    """Run all algorithms on the current maze and collect statistics"""
-    algorithms = [
-        ("Depth-First Search", MODE_DFS),
-        ("Breadth-First Search", MODE_BFS),
-        ("Uniform-Cost Search", MODE_UCS),
-        ("A* Search (f = g + h)", MODE_A1),
-        ("A* Search (f = h)", MODE_A2),
-        ("Ant Colony Optimization", MODE_ACO),
-    ]
+COMPARED_ALGORITHMS = [
+    ("Depth-First Search", MODE_DFS),
+    ("Breadth-First Search", MODE_BFS),
+    ("Uniform-Cost Search", MODE_UCS),
+    ("Uniform-Cost Search (heap)", MODE_UCS_HEAP),
+    ("A* Search (f = g + h)", MODE_A1),
+    ("A* Search (f = h)", MODE_A2),
+    ("Ant Colony Optimization", MODE_ACO),
+]
+PROGRESS_WAIT_MS = 100  # Longest wait between redraws of the progress screen
+
+
+def compare_algorithms(game, progress=None):
+    """Run all algorithms on the current maze and collect statistics
+
+    progress, if given, is a ComparisonRun to report to. The comparison
+    stops before the next algorithm once it is cancelled.
+    """
+    # One search state shared by every run, cleared in between
+    search_map = new_search_map(game.rows * game.cols)
+    parents = new_parents(game.rows * game.cols)
 
     stats = []
-    for name, mode in algorithms:
+    for index, (name, mode) in enumerate(COMPARED_ALGORITHMS):
+        if progress is not None:
+            if progress.cancelled:
+                break
+            progress.completed = index
+            progress.current = name
         print(f"Running {name}...")  # Debug output
         try:
-            stat = run_algorithm_with_stats(game, name, mode)
+            stat = run_algorithm_with_stats(game, name, mode, search_map, parents)
             if stat and hasattr(stat, "cells_explored"):
                 stats.append(stat)
                 print(f"  Collected stats for {name}")
@@ -330,6 +119,83 @@ def compare_algorithms(game):
     return stats
 
 
+class ComparisonRun:
+    """compare_algorithms running on a worker thread.
+
+    Solving every algorithm can take a long time on a large maze, so it
+    runs off the UI thread while run_comparison keeps the window responsive.
+    completed and current tell how far it has got; stats is set once it has
+    finished. cancel() stops it before the next algorithm.
+    """
+
+    def __init__(self, game):
+        self.total = len(COMPARED_ALGORITHMS)
+        self.completed = 0  # Algorithms already run
+        self.current = None  # Name of the algorithm running now
+        self.cancelled = False
+        self.finished = False
+        self.stats = None
+        self.thread = threading.Thread(target=self.run, args=(game,), daemon=True)
+        self.thread.start()
+
+    def run(self, game):
+        self.stats = compare_algorithms(game, self)
+        self.finished = True
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def run_comparison(screen, game):
+    """Compare the algorithms on a worker thread, showing progress meanwhile.
+
+    Returns the stats, or None if the user pressed Escape or closed the
+    window. A QUIT event is posted again for the caller to handle.
+    """
+    run = ComparisonRun(game)
+    while not run.finished:
+        event = pygame.event.wait(PROGRESS_WAIT_MS)
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT:
+            events.insert(0, event)
+        for event in events:
+            if event.type == pygame.QUIT:
+                run.cancel()
+                pygame.event.post(event)
+                return None
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                run.cancel()
+                return None
+            elif event.type == pygame.VIDEORESIZE:
+                if not screen.get_flags() & pygame.FULLSCREEN:
+                    screen = pygame.display.set_mode(
+                        (event.w, event.h), pygame.RESIZABLE
+                    )
+        draw_comparison_progress(screen, run)
+        pygame.display.flip()
+    return run.stats
+
+
+def draw_comparison_progress(screen, run):
+    """Draw which algorithm a ComparisonRun is on"""
+    window_width, window_height = screen.get_size()
+    screen.fill(BACKGROUND_COLOR)
+    lines = [
+        (TEXT_FONT, "Comparing algorithms...", BLACK),
+        (
+            TEXT_FONT,
+            f"{run.current or 'Starting'} ({run.completed + 1}/{run.total})",
+            BLACK,
+        ),
+        (SMALL_FONT, "Press Esc to cancel", (90, 90, 90)),
+    ]
+    y = window_height // 2 - 50
+    for font, text, color in lines:
+        surf = render_text(font, text, True, color)
+        screen.blit(surf, (window_width // 2 - surf.get_width() // 2, y))
+        y += surf.get_height() + 12
+
+
 def create_comparison_table(stats):
     """Create a formatted table for the stats"""
     headers = ["Algorithm", "Cells Explored", "Max Memory", "Path Length", "Time (s)"]
@@ -355,249 +221,166 @@ def get_algorithm_colors():
         "Depth-First Search": (255, 100, 100),  # Red
         "Breadth-First Search": (100, 100, 255),  # Blue
         "Uniform-Cost Search": (100, 255, 100),  # Green
+        "Uniform-Cost Search (heap)": (0, 160, 120),  # Teal green
         "A* Search (f = g + h)": (255, 165, 0),  # Orange
         "A* Search (f = h)": (128, 0, 128),  # Purple
         "Ant Colony Optimization": (255, 192, 203),  # Pink
     }
 
 
-# Fix for the show_comparison_screen function to enable proper scrolling
-
-
-def show_comparison_screen(screen, stats, back_callback):
-    """Display a comparison screen with the algorithm statistics"""
-    running = True
-    scroll_y = 0
-    max_scroll_y = 0
-    window_width, window_height = screen.get_size()
-    # Background gradient colors
-    gradient_top = (220, 230, 240)  # Light blue-gray for the top of the screen
-    gradient_bottom = (170, 190, 210)  # Slightly darker blue-gray for the bottom
-
-    # Check if we have valid stats to display
-    if not stats or len(stats) == 0:
-        # Show error message and return
-        screen.fill(BACKGROUND_COLOR)
-        error_surf = TEXT_FONT.render("No comparison data available", True, BLACK)
-        screen.blit(
-            error_surf,
-            (window_width // 2 - error_surf.get_width() // 2, window_height // 2 - 20),
-        )
-
-        # Add back button
-        back_button = pygame.Rect(
-            window_width // 2 - 60, window_height // 2 + 20, 120, 40
-        )
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        is_hovered = back_button.collidepoint(mouse_x, mouse_y)
-        draw_button(screen, back_button, "Back", BUTTON_FONT, is_hovered)
-
-        pygame.display.flip()
-
-        # Wait for user to click back or press escape
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        waiting = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1 and back_button.collidepoint(event.pos):
-                        waiting = False
-
-        back_callback()
-        return
-
-    # Create table data
-    headers, rows = create_comparison_table(stats)
-
-    # Calculate column widths
-    col_widths = [
-        max(len(headers[i]), max(len(row[i]) for row in rows))
-        for i in range(len(headers))
-    ]
-    col_widths = [
-        width * 12 + 50 for width in col_widths
-    ]  # Scale by font width with padding
-
-    # Fixed position for back button (always visible)
-    back_button = pygame.Rect(window_width - 180, window_height - 70, 150, 50)
-
-    # Algorithm colors for visualization with improved contrast
-    algorithm_colors = {
-        "Depth-First Search": (220, 70, 70),  # Brighter red
-        "Breadth-First Search": (70, 100, 230),  # Brighter blue
-        "Uniform-Cost Search": (50, 200, 100),  # Vibrant green
-        "A* Search (f = g + h)": (255, 140, 0),  # Bright orange
-        "A* Search (f = h)": (148, 0, 211),  # Vivid purple
-        "Ant Colony Optimization": (255, 105, 180),  # Hot pink
-    }
-
-    # Pre-calculate the total content height (important for scrolling)
-    # Base calculations
-    table_height = 150 + len(rows) * 40  # Header + rows
-    metrics_section_height = 50  # Section title
-
-    # Calculate bar charts height
-    metrics = [
-        ("Cells Explored (lower is better)", lambda s: s.cells_explored, False),
-        (
-            "Max Memory Usage (lower is better)",
-            lambda s: s.max_frontier_size,
-            False,
-        ),
-        ("Path Length (lower is better)", lambda s: s.path_length, False),
-        ("Execution Time (lower is better)", lambda s: s.execution_time, False),
-    ]
+# Algorithm colors for visualization with improved contrast
+ALGORITHM_COLORS = {
+    "Depth-First Search": (220, 70, 70),  # Brighter red
+    "Breadth-First Search": (70, 100, 230),  # Brighter blue
+    "Uniform-Cost Search": (50, 200, 100),  # Vibrant green
+    "Uniform-Cost Search (heap)": (0, 140, 110),  # Deep teal
+    "A* Search (f = g + h)": (255, 140, 0),  # Bright orange
+    "A* Search (f = h)": (148, 0, 211),  # Vivid purple
+    "Ant Colony Optimization": (255, 105, 180),  # Hot pink
+}
+
+# Metrics charted in the report: title, value of a stat, higher is better
+REPORT_METRICS = [
+    ("Cells Explored (lower is better)", lambda s: s.cells_explored, False),
+    (
+        "Max Memory Usage (lower is better)",
+        lambda s: s.max_frontier_size,
+        False,
+    ),
+    ("Path Length (lower is better)", lambda s: s.path_length, False),
+    ("Execution Time (lower is better)", lambda s: s.execution_time, False),
+]
+
+REPORT_TILE_HEIGHT = 1024  # Height of each pre-rendered slice of the report
+MAX_REPORT_TILES = 8  # Slices kept at once; the rest are redrawn on demand
+
+
+class ComparisonReport:
+    """The scrolling part of the comparison screen, rendered off screen.
+
+    The table, bar charts and notes are laid out once for a list of stats
+    and a window width, in report coordinates starting at 0 at the top of
+    the table. They are drawn into transparent horizontal tiles of
+    REPORT_TILE_HEIGHT pixels the first time each tile scrolls into view, so
+    scrolling only blits slices of finished tiles however long the report
+    is. A new report is needed only when the stats or window width change.
+    """
 
     bar_height = 30
     bar_spacing = 15
-    metrics_height = 0
-
-    for _, _, _ in metrics:
-        metrics_height += 45  # Metric title + spacing
-        metrics_height += (bar_height + bar_spacing) * len(
-            stats
-        )  # Bars for each algorithm
-        metrics_height += 20  # Extra space between metrics
-
-    # Notes section height
-    notes_height = 180  # Title + lines
-
-    # Total content height
-    total_content_height = (
-        table_height + metrics_section_height + metrics_height + notes_height + 100
-    )  # Extra padding
-
-    # Main comparison loop
-    while running:
-        # Update max scroll based on calculated content height
-        content_height = total_content_height
-        max_scroll_y = max(0, content_height - window_height + 100)  # Add padding
-
-        # Process events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-                pygame.quit()
-                return
-
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                    back_callback()
-                    return
+    name_width = 300  # Width for algorithm names
 
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    mx, my = event.pos
-                    if back_button.collidepoint(mx, my):
-                        running = False
-                        back_callback()
-                        return
-
-                # Critical: Handle mouse wheel scrolling properly
-                elif event.button == 4:  # Mouse wheel up
-                    scroll_y = max(0, scroll_y - 30)
-
-                elif event.button == 5:  # Mouse wheel down
-                    scroll_y = min(max_scroll_y, scroll_y + 30)
+    def __init__(self, stats, width):
+        self.stats = stats
+        self.width = width
+        self.headers, self.rows = create_comparison_table(stats)
 
-            # Another way to handle scrolling
-            elif event.type == pygame.MOUSEWHEEL:
-                if event.y > 0:  # Scroll up
-                    scroll_y = max(0, scroll_y - 30)
-                elif event.y < 0:  # Scroll down
-                    scroll_y = min(max_scroll_y, scroll_y + 30)
-
-        # Draw gradient background
-        for y in range(window_height):
-            # Calculate color for this row (linear interpolation)
-            ratio = y / window_height
-            r = int(gradient_top[0] * (1 - ratio) + gradient_bottom[0] * ratio)
-            g = int(gradient_top[1] * (1 - ratio) + gradient_bottom[1] * ratio)
-            b = int(gradient_top[2] * (1 - ratio) + gradient_bottom[2] * ratio)
-            color = (r, g, b)
-
-            # Draw horizontal line with this color
-            pygame.draw.line(screen, color, (0, y), (window_width, y))
-
-        # Draw fixed header (doesn't scroll)
-        header_height = 80
-        pygame.draw.rect(screen, (40, 60, 80), (0, 0, window_width, header_height))
-
-        # Add a decorative header line
-        pygame.draw.rect(screen, (255, 215, 0), (0, header_height - 3, window_width, 3))
-
-        # Draw title with shadow effect
-        title_text = "Algorithm Comparison Results"
-        shadow_offset = 2
+        # Calculate column widths
+        col_widths = [
+            max(len(self.headers[i]), max(len(row[i]) for row in self.rows))
+            for i in range(len(self.headers))
+        ]
+        self.col_widths = [
+            width * 12 + 50 for width in col_widths
+        ]  # Scale by font width with padding
+
+        self.table_width = sum(self.col_widths) + 100
+        self.table_height = 50 + len(self.rows) * 40 + 20
+        self.analysis_y = 60 + len(self.rows) * 40 + 30
+        self.metric_height = 45 + (self.bar_height + self.bar_spacing) * len(stats) + 20
+        self.notes_y = self.analysis_y + 50 + len(REPORT_METRICS) * self.metric_height
+        self.height = self.notes_y - 10 + 180
+        self.tiles = OrderedDict()
+
+    def tile(self, index):
+        """Surface of tile index, rendering it if it isn't cached"""
+        tile = self.tiles.get(index)
+        if tile is None:
+            top = index * REPORT_TILE_HEIGHT
+            height = min(REPORT_TILE_HEIGHT, self.height - top)
+            tile = pygame.Surface((self.width, height), pygame.SRCALPHA)
+            tile.fill((0, 0, 0, 0))
+            self.paint(tile, top)
+            self.tiles[index] = tile
+            if len(self.tiles) > MAX_REPORT_TILES:
+                self.tiles.popitem(last=False)
+        else:
+            self.tiles.move_to_end(index)
+        return tile
+
+    def draw(self, surface, x, y, clip_top=0):
+        """Blit the report with its top-left corner at (x, y).
+
+        Only tiles showing between clip_top and the bottom of the surface are
+        blitted, or rendered if they are not cached yet.
+        """
+        first_row = max(0, clip_top - y)
+        last_row = min(self.height, surface.get_height() - y)
+        if last_row <= first_row:
+            return
+        first = first_row // REPORT_TILE_HEIGHT
+        last = (last_row - 1) // REPORT_TILE_HEIGHT
+        for index in range(first, last + 1):
+            surface.blit(self.tile(index), (x, y + index * REPORT_TILE_HEIGHT))
+
+    def paint(self, surface, top):
+        """Draw the part of the report from report y top onto surface"""
+        bottom = top + surface.get_height()
+        width = self.width
+        col_widths = self.col_widths
+        bar_height = self.bar_height
+        bar_spacing = self.bar_spacing
+        name_width = self.name_width
 
-        # Shadow
-        shadow_surf = pygame.font.SysFont("Arial", 36, bold=True).render(
-            title_text, True, (20, 30, 40)
-        )
-        screen.blit(shadow_surf, (20 + shadow_offset, 20 + shadow_offset))
+        # Table background
+        table_width = self.table_width
+        if top < self.table_height:
+            table_rect = pygame.Rect(50, -top, table_width, self.table_height)
+            pygame.draw.rect(surface, (230, 240, 250), table_rect, border_radius=10)
+            pygame.draw.rect(
+                surface, (100, 120, 140), table_rect, width=2, border_radius=10
+            )
 
-        # Main text
-        title_surf = pygame.font.SysFont("Arial", 36, bold=True).render(
-            title_text, True, (255, 255, 255)
-        )
-        screen.blit(title_surf, (20, 20))
+            # Draw table header with background
+            header_bg = pygame.Rect(50, -top, table_width, 40)
+            pygame.draw.rect(surface, (60, 90, 120), header_bg, border_radius=10)
 
-        # Draw scrollable content
-        content_y = header_height + 20 - scroll_y
+            x_offset = 60
+            header_y = 10 - top
+            for i, header in enumerate(self.headers):
+                header_surf = render_text(
+                    get_font("Arial", 22, bold=True), header, True, WHITE
+                )
+                surface.blit(header_surf, (x_offset, header_y))
+                x_offset += col_widths[i]
 
-        # Table background
-        table_width = sum(col_widths) + 100
-        table_height = 50 + len(rows) * 40 + 20
-        table_rect = pygame.Rect(50, content_y, table_width, table_height)
-        pygame.draw.rect(screen, (230, 240, 250, 200), table_rect, border_radius=10)
-        pygame.draw.rect(screen, (100, 120, 140), table_rect, width=2, border_radius=10)
-
-        # Draw table header with background
-        header_bg = pygame.Rect(50, content_y, table_width, 40)
-        pygame.draw.rect(screen, (60, 90, 120), header_bg, border_radius=10)
-
-        x_offset = 60
-        header_y = content_y + 10
-        for i, header in enumerate(headers):
-            header_surf = pygame.font.SysFont("Arial", 22, bold=True).render(
-                header, True, WHITE
+            # Draw separator line
+            pygame.draw.line(
+                surface,
+                (180, 190, 200),
+                (60, header_y + 30),
+                (table_width - 20, header_y + 30),
+                2,
             )
-            screen.blit(header_surf, (x_offset, header_y))
-            x_offset += col_widths[i]
-
-        # Draw separator line
-        pygame.draw.line(
-            screen,
-            (180, 190, 200),
-            (60, header_y + 30),
-            (table_width - 20, header_y + 30),
-            2,
-        )
 
         # Draw table rows with alternating background colors
-        row_y = header_y + 50
-        for idx, row in enumerate(rows):
-            # Skip if row is outside visible area (optimization)
-            if row_y + 30 < header_height or row_y > window_height:
+        row_y = 60
+        for idx, row in enumerate(self.rows):
+            # Skip if row is outside this part of the report
+            if row_y + 30 < top or row_y - 5 > bottom:
                 row_y += 40
                 continue
 
             # Alternating row background
             row_color = (240, 245, 255) if idx % 2 == 0 else (225, 235, 245)
-            row_rect = pygame.Rect(60, row_y - 5, table_width - 20, 30)
-            pygame.draw.rect(screen, row_color, row_rect, border_radius=5)
+            row_rect = pygame.Rect(60, row_y - 5 - top, table_width - 20, 30)
+            pygame.draw.rect(surface, row_color, row_rect, border_radius=5)
 
             # Algorithm-colored indicator
             algo_name = row[0]
-            indicator_color = algorithm_colors.get(algo_name, (150, 150, 150))
+            indicator_color = ALGORITHM_COLORS.get(algo_name, (150, 150, 150))
             pygame.draw.rect(
-                screen, indicator_color, (60, row_y - 5, 8, 30), border_radius=2
+                surface, indicator_color, (60, row_y - 5 - top, 8, 30), border_radius=2
             )
 
             x_offset = 60
@@ -605,66 +388,50 @@ def show_comparison_screen(screen, stats, back_callback):
                 text_color = (
                     BLACK if i > 0 else indicator_color
                 )  # Make algorithm name match its color
-                cell_surf = SMALL_FONT.render(cell, True, text_color)
+                cell_surf = render_text(SMALL_FONT, cell, True, text_color)
 
                 # Bold the first column (algorithm names)
                 if i == 0:
-                    cell_surf = pygame.font.SysFont("Arial", 18, bold=True).render(
-                        cell, True, text_color
+                    cell_surf = render_text(
+                        get_font("Arial", 18, bold=True), cell, True, text_color
                     )
 
-                screen.blit(cell_surf, (x_offset + 15 if i == 0 else x_offset, row_y))
+                surface.blit(
+                    cell_surf, (x_offset + 15 if i == 0 else x_offset, row_y - top)
+                )
                 x_offset += col_widths[i]
 
             row_y += 40
 
         # Performance Analysis section
-        analysis_y = row_y + 30
+        analysis_y = self.analysis_y
 
         # Add section title with decorative accent
-        section_bg = pygame.Rect(50, analysis_y - 10, 350, 40)
-        pygame.draw.rect(screen, (60, 90, 120), section_bg, border_radius=10)
-        title_surf = pygame.font.SysFont("Arial", 24, bold=True).render(
-            "Performance Analysis", True, WHITE
-        )
-        screen.blit(title_surf, (60, analysis_y))
+        if analysis_y - 10 < bottom and analysis_y + 30 > top:
+            section_bg = pygame.Rect(50, analysis_y - 10 - top, 350, 40)
+            pygame.draw.rect(surface, (60, 90, 120), section_bg, border_radius=10)
+            title_surf = render_text(
+                get_font("Arial", 24, bold=True), "Performance Analysis", True, WHITE
+            )
+            surface.blit(title_surf, (60, analysis_y - top))
         analysis_y += 50
 
         # Draw comparisons for each metric
-        metrics = [
-            ("Cells Explored (lower is better)", lambda s: s.cells_explored, False),
-            (
-                "Max Memory Usage (lower is better)",
-                lambda s: s.max_frontier_size,
-                False,
-            ),
-            ("Path Length (lower is better)", lambda s: s.path_length, False),
-            ("Execution Time (lower is better)", lambda s: s.execution_time, False),
-        ]
-
-        bar_height = 30
-        bar_spacing = 15
-        name_width = 300  # Width for algorithm names
-
-        for metric_name, metric_func, higher_better in metrics:
-            # Skip if this section is outside visible area (optimization)
-            if (
-                analysis_y > window_height + 100
-                or analysis_y + 60 + len(stats) * (bar_height + bar_spacing)
-                < header_height
-            ):
-                # Just update position and skip drawing
-                analysis_y += 45 + (bar_height + bar_spacing) * len(stats) + 20
+        stats = self.stats
+        for metric_name, metric_func, higher_better in REPORT_METRICS:
+            # Skip if this section is outside this part of the report
+            if analysis_y - 10 > bottom or analysis_y + self.metric_height < top:
+                analysis_y += self.metric_height
                 continue
 
             # Draw metric header with background
-            metric_header_bg = pygame.Rect(50, analysis_y - 10, 400, 35)
-            pygame.draw.rect(screen, (80, 100, 130), metric_header_bg, border_radius=8)
+            metric_header_bg = pygame.Rect(50, analysis_y - 10 - top, 400, 35)
+            pygame.draw.rect(surface, (80, 100, 130), metric_header_bg, border_radius=8)
 
-            metric_surf = pygame.font.SysFont("Arial", 20, bold=True).render(
-                metric_name, True, WHITE
+            metric_surf = render_text(
+                get_font("Arial", 20, bold=True), metric_name, True, WHITE
             )
-            screen.blit(metric_surf, (60, analysis_y))
+            surface.blit(metric_surf, (60, analysis_y - top))
             analysis_y += 45
 
             # Sort algorithms by this metric
@@ -677,85 +444,74 @@ def show_comparison_screen(screen, stats, back_callback):
 
             # Draw bars for each algorithm
             for i, stat in enumerate(sorted_stats):
-                # Skip if this bar is outside visible area
-                if (
-                    analysis_y > window_height + 50
-                    or analysis_y + bar_height < header_height
-                ):
+                # Skip if this bar is outside this part of the report
+                if analysis_y - 5 > bottom or analysis_y + bar_height + 5 < top:
                     analysis_y += bar_height + bar_spacing
                     continue
 
                 value = metric_func(stat)
-                bar_length = int((value / max_value) * (window_width - 500))
+                bar_length = int((value / max_value) * (width - 500))
+                bar_y = analysis_y - top
 
                 # Background for this bar row
-                row_bg = pygame.Rect(
-                    60, analysis_y - 5, window_width - 120, bar_height + 10
-                )
+                row_bg = pygame.Rect(60, bar_y - 5, width - 120, bar_height + 10)
                 bg_color = (240, 245, 255) if i % 2 == 0 else (225, 235, 245)
-                pygame.draw.rect(screen, bg_color, row_bg, border_radius=6)
+                pygame.draw.rect(surface, bg_color, row_bg, border_radius=6)
 
                 # Draw ranking and algorithm name
-                algorithm_color = algorithm_colors.get(
+                algorithm_color = ALGORITHM_COLORS.get(
                     stat.algorithm_name, (150, 150, 150)
                 )
-                rank_surf = pygame.font.SysFont("Arial", 18, bold=True).render(
-                    f"{i+1}. {stat.algorithm_name}", True, algorithm_color
+                rank_surf = render_text(
+                    get_font("Arial", 18, bold=True),
+                    f"{i+1}. {stat.algorithm_name}",
+                    True,
+                    algorithm_color,
                 )
-                screen.blit(
+                surface.blit(
                     rank_surf,
-                    (80, analysis_y + (bar_height - rank_surf.get_height()) // 2),
+                    (80, bar_y + (bar_height - rank_surf.get_height()) // 2),
                 )
 
-                # Draw bar with gradient effect
-                bar_rect = pygame.Rect(name_width, analysis_y, bar_length, bar_height)
-                r, g, b = algorithm_color
-
-                # Gradient effect (darker to lighter)
-                for x in range(bar_length):
-                    gradient_ratio = x / max(1, bar_length)
-                    # Brighten color as we move right
-                    color = (
-                        min(255, int(r + (255 - r) * gradient_ratio * 0.5)),
-                        min(255, int(g + (255 - g) * gradient_ratio * 0.5)),
-                        min(255, int(b + (255 - b) * gradient_ratio * 0.5)),
-                    )
-                    pygame.draw.line(
-                        screen,
-                        color,
-                        (name_width + x, analysis_y),
-                        (name_width + x, analysis_y + bar_height),
+                # Draw bar with gradient effect (darker to lighter), cached
+                bar_rect = pygame.Rect(name_width, bar_y, bar_length, bar_height)
+                if bar_length > 0:
+                    surface.blit(
+                        bar_gradient((bar_length, bar_height + 1), algorithm_color),
+                        bar_rect,
                     )
 
                 # Bar outline
                 pygame.draw.rect(
-                    screen, (100, 100, 100), bar_rect, width=1, border_radius=4
+                    surface, (100, 100, 100), bar_rect, width=1, border_radius=4
                 )
 
                 # Draw value with contrasting background for readability
                 value_text = f"{value:.4f}" if isinstance(value, float) else str(value)
-                value_surf = pygame.font.SysFont("Arial", 18, bold=True).render(
-                    value_text, True, BLACK
+                value_surf = render_text(
+                    get_font("Arial", 18, bold=True), value_text, True, BLACK
                 )
 
                 # Value background (white rounded rectangle)
                 text_bg_rect = pygame.Rect(
                     name_width + bar_length + 10,
-                    analysis_y + (bar_height - value_surf.get_height()) // 2 - 2,
+                    bar_y + (bar_height - value_surf.get_height()) // 2 - 2,
                     value_surf.get_width() + 10,
                     value_surf.get_height() + 4,
                 )
-                pygame.draw.rect(screen, (255, 255, 255), text_bg_rect, border_radius=4)
                 pygame.draw.rect(
-                    screen, (200, 200, 200), text_bg_rect, width=1, border_radius=4
+                    surface, (255, 255, 255), text_bg_rect, border_radius=4
+                )
+                pygame.draw.rect(
+                    surface, (200, 200, 200), text_bg_rect, width=1, border_radius=4
                 )
 
                 # Draw value text
-                screen.blit(
+                surface.blit(
                     value_surf,
                     (
                         name_width + bar_length + 15,
-                        analysis_y + (bar_height - value_surf.get_height()) // 2,
+                        bar_y + (bar_height - value_surf.get_height()) // 2,
                     ),
                 )
 
@@ -764,20 +520,21 @@ def show_comparison_screen(screen, stats, back_callback):
             analysis_y += 20  # Extra space between metrics
 
         # Draw analysis explanation with enhanced visual style
-        # Skip if out of view
-        if analysis_y < window_height + 200 and analysis_y + 180 > header_height:
-            explanation_bg = pygame.Rect(50, analysis_y - 10, window_width - 100, 180)
-            pygame.draw.rect(
-                screen, (230, 240, 250, 200), explanation_bg, border_radius=10
-            )
+        analysis_y = self.notes_y
+        if analysis_y - 10 < bottom:
+            explanation_bg = pygame.Rect(50, analysis_y - 10 - top, width - 100, 180)
+            pygame.draw.rect(surface, (230, 240, 250), explanation_bg, border_radius=10)
             pygame.draw.rect(
-                screen, (100, 120, 140), explanation_bg, width=2, border_radius=10
+                surface, (100, 120, 140), explanation_bg, width=2, border_radius=10
             )
 
-            explanation_title = pygame.font.SysFont("Arial", 22, bold=True).render(
-                "Performance Notes:", True, (60, 90, 120)
+            explanation_title = render_text(
+                get_font("Arial", 22, bold=True),
+                "Performance Notes:",
+                True,
+                (60, 90, 120),
             )
-            screen.blit(explanation_title, (70, analysis_y))
+            surface.blit(explanation_title, (70, analysis_y - top))
             analysis_y += 35
 
             explanation_lines = [
@@ -789,16 +546,209 @@ def show_comparison_screen(screen, stats, back_callback):
             ]
 
             for line in explanation_lines:
-                line_surf = pygame.font.SysFont("Arial", 18).render(
-                    line, True, (40, 40, 40)
-                )
-                screen.blit(line_surf, (70, analysis_y))
+                line_surf = render_text(get_font("Arial", 18), line, True, (40, 40, 40))
+                surface.blit(line_surf, (70, analysis_y - top))
                 analysis_y += 28
 
-        # Draw back button (always visible, fixed position)
+
+def show_comparison_screen(screen, stats, back_callback, minimap=None):
+    """Display a comparison screen with the algorithm statistics.
+
+    A Minimap, if given, is shown beside the table; clicking it goes back
+    to the maze with the camera moved there.
+    """
+    running = True
+    scroll_y = 0
+    window_width, window_height = screen.get_size()
+    # Background gradient colors
+    gradient_top = (220, 230, 240)  # Light blue-gray for the top of the screen
+    gradient_bottom = (170, 190, 210)  # Slightly darker blue-gray for the bottom
+
+    # Check if we have valid stats to display
+    if not stats or len(stats) == 0:
+        # Show error message and return
+        screen.fill(BACKGROUND_COLOR)
+        error_surf = render_text(TEXT_FONT, "No comparison data available", True, BLACK)
+        screen.blit(
+            error_surf,
+            (window_width // 2 - error_surf.get_width() // 2, window_height // 2 - 20),
+        )
+
+        # Add back button
+        back_button = pygame.Rect(
+            window_width // 2 - 60, window_height // 2 + 20, 120, 40
+        )
         mouse_x, mouse_y = pygame.mouse.get_pos()
-        is_back_hovered = back_button.collidepoint(mouse_x, mouse_y)
+        is_hovered = back_button.collidepoint(mouse_x, mouse_y)
+        draw_button(screen, back_button, "Back", BUTTON_FONT, is_hovered)
+
+        pygame.display.flip()
+
+        # Wait for user to click back or press escape
+        waiting = True
+        while waiting:
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    waiting = False
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1 and back_button.collidepoint(event.pos):
+                    waiting = False
+
+        back_callback()
+        return
+
+    # The scrolling content, rendered once per stats and window width
+    report = ComparisonReport(stats, window_width)
+    header_height = 80
+
+    # Fixed position for back button (always visible)
+    back_button = pygame.Rect(window_width - 180, window_height - 70, 150, 50)
+
+    if minimap is not None:
+        minimap.rect = None  # Not clickable until drawn on this screen
+
+    clock = pygame.time.Clock()
+    dirty = True  # Whether the screen needs drawing again
+    is_back_hovered = None
+
+    # Main comparison loop
+    while running:
+        # Re-lay out only when the window changed size
+        if screen.get_size() != (window_width, window_height):
+            window_width, window_height = screen.get_size()
+            if window_width != report.width:
+                report = ComparisonReport(stats, window_width)
+            back_button = pygame.Rect(window_width - 180, window_height - 70, 150, 50)
+            dirty = True
+
+        # Update max scroll based on the report's height
+        content_height = report.height + header_height + 120
+        max_scroll_y = max(0, content_height - window_height)  # Add padding
+        scroll_y = min(scroll_y, max_scroll_y)
+
+        # Nothing here animates, so sleep until there is input to handle
+        if dirty:
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            events = pygame.event.get()
+            if event.type != pygame.NOEVENT:
+                events.insert(0, event)
+
+        # Process events
+        for event in events:
+            if event.type != pygame.MOUSEMOTION:
+                dirty = True  # Pointer motion only matters for the hover below
+            if event.type == pygame.QUIT:
+                running = False
+                pygame.quit()
+                return
+
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                    back_callback()
+                    return
+
+            elif event.type == pygame.VIDEORESIZE:
+                if not screen.get_flags() & pygame.FULLSCREEN:
+                    screen = pygame.display.set_mode(
+                        (event.w, event.h), pygame.RESIZABLE
+                    )
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:  # Left click
+                    mx, my = event.pos
+                    if back_button.collidepoint(mx, my):
+                        running = False
+                        back_callback()
+                        return
+                    if minimap is not None and minimap.handle_click((mx, my)):
+                        running = False
+                        back_callback()
+                        return
+
+                # Critical: Handle mouse wheel scrolling properly
+                elif event.button == 4:  # Mouse wheel up
+                    scroll_y = max(0, scroll_y - 30)
 
+                elif event.button == 5:  # Mouse wheel down
+                    scroll_y = min(max_scroll_y, scroll_y + 30)
+
+            # Another way to handle scrolling
+            elif event.type == pygame.MOUSEWHEEL:
+                if event.y > 0:  # Scroll up
+                    scroll_y = max(0, scroll_y - 30)
+                elif event.y < 0:  # Scroll down
+                    scroll_y = min(max_scroll_y, scroll_y + 30)
+
+        # Redraw when the pointer moves onto or off the back button
+        hovered = bool(back_button.collidepoint(pygame.mouse.get_pos()))
+        if hovered != is_back_hovered:
+            is_back_hovered = hovered
+            dirty = True
+        if not dirty:
+            continue
+        dirty = False
+
+        # Draw gradient background, rendered once per window size
+        screen.blit(
+            vertical_gradient(
+                (window_width, window_height), gradient_top, gradient_bottom
+            ),
+            (0, 0),
+        )
+
+        # Draw the visible slice of the scrollable content below the header
+        content_y = header_height + 20 - scroll_y
+        screen.set_clip(
+            pygame.Rect(0, header_height, window_width, window_height - header_height)
+        )
+        report.draw(screen, 0, content_y, header_height)
+        screen.set_clip(None)
+
+        # Draw fixed header (doesn't scroll)
+        pygame.draw.rect(screen, (40, 60, 80), (0, 0, window_width, header_height))
+
+        # Add a decorative header line
+        pygame.draw.rect(screen, (255, 215, 0), (0, header_height - 3, window_width, 3))
+
+        # Draw title with shadow effect
+        title_text = "Algorithm Comparison Results"
+        shadow_offset = 2
+
+        # Shadow
+        shadow_surf = render_text(
+            get_font("Arial", 36, bold=True), title_text, True, (20, 30, 40)
+        )
+        screen.blit(shadow_surf, (20 + shadow_offset, 20 + shadow_offset))
+
+        # Main text
+        title_surf = render_text(
+            get_font("Arial", 36, bold=True), title_text, True, (255, 255, 255)
+        )
+        screen.blit(title_surf, (20, 20))
+
+        # Minimap of the compared maze to the right of the table, if it fits
+        if minimap is not None:
+            minimap_size = min(
+                MINIMAP_SIZE,
+                report.table_height,
+                window_width - report.table_width - 150,
+            )
+            if minimap_size >= 60 and content_y >= header_height:
+                minimap_w, _ = minimap.size_for(minimap_size)
+                minimap.draw(
+                    screen, window_width - minimap_w - 50, content_y, minimap_size
+                )
+            else:
+                minimap.rect = None
+
+        # Draw back button (always visible, fixed position)
         # Draw back button with gradient
         button_color = (50, 120, 200) if is_back_hovered else (60, 100, 160)
         pygame.draw.rect(screen, button_color, back_button, border_radius=8)
@@ -819,7 +769,7 @@ def show_comparison_screen(screen, stats, back_callback):
         pygame.draw.rect(screen, (40, 80, 140), shadow_rect, border_radius=2)
 
         # Button text
-        button_text = BUTTON_FONT.render("Back to Maze", True, WHITE)
+        button_text = render_text(BUTTON_FONT, "Back to Maze", True, WHITE)
         screen.blit(
             button_text,
             (
@@ -864,10 +814,11 @@ def show_comparison_screen(screen, stats, back_callback):
             )
 
         pygame.display.flip()
+        clock.tick(60)
         # Add copyright notice (fixed at the bottom of the screen)
         copyright_text = "© Dinesh Pandikona. All rights reserved 2025"
-        copyright_surf = pygame.font.SysFont("Arial", 16).render(
-            copyright_text, True, (200, 200, 200)
+        copyright_surf = render_text(
+            get_font("Arial", 16), copyright_text, True, (200, 200, 200)
         )
         screen.blit(
             copyright_surf,
@@ -0,0 +1,121 @@
+# camera.py
+import math
+import pygame
+
+MAX_CELL_SIZE = 64  # Pixels per cell at the closest zoom
+ZOOM_STEP = 1.25  # Zoom factor of one mouse wheel notch
+
+
+class Camera:
+    """Zoom and pan state for looking at a maze through a screen viewport.
+
+    cell_size is the number of screen pixels per cell. It is kept whole from
+    one pixel up so cells and walls stay crisp, and may drop below one pixel
+    when a large maze is zoomed out to fit. x and y are the maze pixel shown
+    at the viewport's top-left corner. Until the user zooms or pans the
+    camera keeps the whole maze fitted to the viewport.
+    """
+
+    def __init__(self, rows, cols, viewport=(0, 0, 1, 1)):
+        self.rows = rows
+        self.cols = cols
+        self.viewport = pygame.Rect(viewport)
+        self.cell_size = 1
+        self.x = 0.0
+        self.y = 0.0
+        self.fitted = True
+        self.fit()
+
+    def fit_size(self):
+        """Cell size that shows the whole maze in the viewport"""
+        size = min(self.viewport.width / self.cols, self.viewport.height / self.rows)
+        return max(1, int(size)) if size >= 1 else size
+
+    def fit(self):
+        self.cell_size = min(self.fit_size(), MAX_CELL_SIZE)
+        self.x = self.y = 0.0
+        self.fitted = True
+
+    def set_maze(self, rows, cols):
+        """Show a maze of a new shape, fitted to the viewport"""
+        if (rows, cols) != (self.rows, self.cols):
+            self.rows = rows
+            self.cols = cols
+            self.fit()
+
+    def set_viewport(self, viewport):
+        viewport = pygame.Rect(viewport)
+        resized = viewport.size != self.viewport.size
+        self.viewport = viewport
+        if resized:
+            if self.fitted:
+                self.fit()
+            else:
+                self.clamp()
+
+    def clamp(self):
+        """Keep the maze in view; a maze narrower than the viewport sits left"""
+        width = self.cols * self.cell_size
+        height = self.rows * self.cell_size
+        self.x = min(max(0.0, self.x), max(0.0, width - self.viewport.width))
+        self.y = min(max(0.0, self.y), max(0.0, height - self.viewport.height))
+
+    def zoom(self, factor, anchor=None):
+        """Scale the cell size by factor, keeping the anchor point in place"""
+        if anchor is None:
+            anchor = self.viewport.center
+        size = self.cell_size * factor
+        if size >= 1:
+            # Whole pixels, moving by at least one so small sizes still zoom
+            size = round(size)
+            if size == self.cell_size:
+                size += 1 if factor > 1 else -1
+        size = min(max(size, min(self.fit_size(), 1)), MAX_CELL_SIZE)
+        ax = anchor[0] - self.viewport.x
+        ay = anchor[1] - self.viewport.y
+        scale = size / self.cell_size
+        self.x = (self.x + ax) * scale - ax
+        self.y = (self.y + ay) * scale - ay
+        self.cell_size = size
+        self.fitted = False
+        self.clamp()
+
+    def pan(self, dx, dy):
+        """Move the view by a screen distance, as when dragging the maze"""
+        self.x -= dx
+        self.y -= dy
+        self.fitted = False
+        self.clamp()
+
+    def center_on(self, row, col):
+        self.x = (col + 0.5) * self.cell_size - self.viewport.width / 2
+        self.y = (row + 0.5) * self.cell_size - self.viewport.height / 2
+        self.fitted = False
+        self.clamp()
+
+    def show_cell(self, row, col):
+        """Pan just far enough to bring a cell into view"""
+        size = self.cell_size
+        x = min(max(self.x, (col + 1) * size - self.viewport.width), col * size)
+        y = min(max(self.y, (row + 1) * size - self.viewport.height), row * size)
+        if (x, y) != (self.x, self.y):
+            self.x = x
+            self.y = y
+            self.fitted = False
+            self.clamp()
+
+    def origin(self):
+        """Screen position of the maze's top-left corner"""
+        return (
+            self.viewport.x - int(self.x),
+            self.viewport.y - int(self.y),
+        )
+
+    def visible_cells(self):
+        """(row0, row1, col0, col1) of the cells inside the viewport"""
+        size = self.cell_size
+        row0 = max(0, int(self.y // size))
+        col0 = max(0, int(self.x // size))
+        row1 = min(self.rows, math.ceil((self.y + self.viewport.height) / size))
+        col1 = min(self.cols, math.ceil((self.x + self.viewport.width) / size))
+        return row0, row1, col0, col1
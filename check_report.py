@@ -0,0 +1,60 @@
+# check_report.py
+# Checks headlessly that scrolling the tiled comparison report matches a
+# full render of it
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from algorithm_comparison import ALGORITHM_COLORS, ComparisonReport
+from config import BACKGROUND_COLOR
+from stats import AlgorithmStats
+
+
+def check_report_tiles(stats, width=1200, height=800, header_height=80):
+    """Count pixels where the tiled report differs from one full rendering.
+
+    Scrolls through the whole report the way the comparison screen does,
+    comparing each frame with the report painted onto one tall surface.
+    """
+    report = ComparisonReport(stats, width)
+    full = pygame.Surface((width, report.height), pygame.SRCALPHA)
+    full.fill((0, 0, 0, 0))
+    report.paint(full, 0)
+
+    clip = pygame.Rect(0, header_height, width, height - header_height)
+    tiled = pygame.Surface((width, height))
+    expected = pygame.Surface((width, height))
+    differences = 0
+    for scroll_y in range(0, report.height, 97):
+        content_y = header_height + 20 - scroll_y
+        for surface in (tiled, expected):
+            surface.fill(BACKGROUND_COLOR)
+            surface.set_clip(clip)
+        report.draw(tiled, 0, content_y, header_height)
+        expected.blit(full, (0, content_y))
+        differences += int(
+            (pygame.surfarray.pixels3d(tiled) != pygame.surfarray.pixels3d(expected))
+            .any(axis=2)
+            .sum()
+        )
+    return differences
+
+
+if __name__ == "__main__":
+    # Usage: python check_report.py [number of algorithms]
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    names = list(ALGORITHM_COLORS)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    stats = []
+    for i in range(count):
+        stat = AlgorithmStats(names[i % len(names)])
+        stat.cells_explored = 3 * i + 1
+        stat.max_frontier_size = i
+        stat.path_length = 50 + i
+        stat.execution_time = 0.01 * i
+        stats.append(stat)
+    differences = check_report_tiles(stats)
+    print(f"{count} algorithms: {differences} pixels differ from a full render")
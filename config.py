@@ -11,19 +11,37 @@ BUTTON_COLOR = (255, 255, 255)  # White buttons
 BUTTON_HOVER = (230, 210, 210)
 HEADER_COLOR = (216, 227, 231)
 
-# Fonts
+# Fonts, loaded once per style and shared by every UI module
 pygame.font.init()
-TITLE_FONT = pygame.font.SysFont("Arial", 48, bold=True)
-TEXT_FONT = pygame.font.SysFont("Arial", 24)
-BUTTON_FONT = pygame.font.SysFont("Arial", 20)
-SMALL_FONT = pygame.font.SysFont("Arial", 18)
-
-# Default Maze Dimensions
-ROW_OPTIONS = [5, 10, 20, 30, 40, 50]
-COL_OPTIONS = [5, 10, 20, 30, 40, 50]
+FONTS = {}
+
+
+def get_font(name, size, bold=False, italic=False):
+    """Shared SysFont for a style, loaded on first use"""
+    key = (name, size, bold, italic)
+    font = FONTS.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        FONTS[key] = font
+    return font
+
+
+TITLE_FONT = get_font("Arial", 48, bold=True)
+TEXT_FONT = get_font("Arial", 24)
+BUTTON_FONT = get_font("Arial", 20)
+SMALL_FONT = get_font("Arial", 18)
+
+# Default Maze Dimensions; the size dropdowns also accept typed sizes
+ROW_OPTIONS = [5, 10, 20, 30, 40, 50, 100, 200, 500, 1000, 2000]
+COL_OPTIONS = [5, 10, 20, 30, 40, 50, 100, 200, 500, 1000, 2000]
+MIN_MAZE_SIDE = 2
+MAX_MAZE_SIDE = 4000
 DEFAULT_ROW_IDX = 2  # 20 rows
 DEFAULT_COL_IDX = 2  # 20 cols
 
+# Maze generator used for new mazes (see generators.GENERATORS)
+DEFAULT_GENERATOR = "kruskal"
+
 # Pathfinding modes
 MODE_IDLE = 0
 MODE_DFS = 1
@@ -33,6 +51,13 @@ MODE_A1 = 4
 MODE_A2 = 5
 MODE_UCS = 6  
 MODE_ACO = 7  
+MODE_UCS_HEAP = 8  # Uniform-Cost Search on a binary heap instead of buckets
+
+# Search animation speed limit, in cell changes shown per frame
+MAX_SEARCH_SPEED = 4096
+
+# Longest the main loop sleeps waiting for input while the screen is still
+IDLE_WAIT_MS = 500
 
 # Window dimensions
 WINDOW_WIDTH = 1200
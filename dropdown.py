@@ -1,6 +1,7 @@
 # dropdown.py
 import pygame
 from config import WHITE, BUTTON_HOVER, BLACK
+from ui_components import render_text
 
 
 class Dropdown:
@@ -18,6 +19,7 @@ class Dropdown:
         text_color=BLACK,
         z_index=0,
         dropdown_direction="down",  # New parameter: "down" or "up"
+        value_range=None,  # (min, max) of numbers that can be typed in
     ):
         self.rect = pygame.Rect(x, y, w, h)
         self.font = font
@@ -30,12 +32,14 @@ class Dropdown:
         self.expanded = False
         self.option_rects = []  # For collision detection
         self.dropdown_direction = dropdown_direction
+        self.value_range = value_range
+        self.typed = ""  # Digits typed while expanded
 
     def draw(self, surface, label, y_offset=0):
         adjusted_y = self.rect.y - y_offset
 
         # Draw label to the left
-        label_surf = self.font.render(label, True, BLACK)
+        label_surf = render_text(self.font, label, True, BLACK)
         label_x = self.rect.x - label_surf.get_width() - 10
         label_y = adjusted_y + (self.rect.height - label_surf.get_height()) // 2
         surface.blit(label_surf, (label_x, label_y))
@@ -50,9 +54,12 @@ class Dropdown:
             surface, (180, 180, 180), adjusted_rect, width=1, border_radius=4
         )
 
-        # Draw selected text
-        selected_text = self.options[self.selected_index]
-        txt_surf = self.font.render(selected_text, True, self.text_color)
+        # Draw selected text, or the number being typed
+        if self.typed:
+            selected_text = self.typed + "_"
+        else:
+            selected_text = self.options[self.selected_index]
+        txt_surf = render_text(self.font, selected_text, True, self.text_color)
         surface.blit(
             txt_surf,
             (
@@ -63,7 +70,7 @@ class Dropdown:
 
         # Draw arrow - different direction based on dropdown_direction
         arrow_char = "▼" if self.dropdown_direction == "down" else "▲"
-        arrow_surf = self.font.render(arrow_char, True, self.text_color)
+        arrow_surf = render_text(self.font, arrow_char, True, self.text_color)
         surface.blit(
             arrow_surf,
             (
@@ -158,7 +165,7 @@ class Dropdown:
                 )
 
                 # Draw option text
-                opt_surf = self.font.render(option, True, self.text_color)
+                opt_surf = render_text(self.font, option, True, self.text_color)
                 surface.blit(
                     opt_surf,
                     (
@@ -179,6 +186,7 @@ class Dropdown:
                 self.rect.x, self.rect.y - y_offset, self.rect.width, self.rect.height
             )
 
+            self.typed = ""
             if adjusted_rect.collidepoint(mouse_x, mouse_y):
                 self.expanded = not self.expanded
                 return False
@@ -195,5 +203,23 @@ class Dropdown:
                 # If clicked outside the dropdown and its options, close it
                 self.expanded = False
 
+        # Typing a number while expanded picks it, adding it as an option
+        elif event.type == pygame.KEYDOWN and self.expanded and self.value_range:
+            low, high = self.value_range
+            if event.unicode.isdigit():
+                self.typed = (self.typed + event.unicode)[: len(str(high))]
+            elif event.key == pygame.K_BACKSPACE:
+                self.typed = self.typed[:-1]
+            elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER) and self.typed:
+                text = str(min(max(int(self.typed), low), high))
+                old_text = self.options[self.selected_index]
+                if text not in self.options:
+                    self.options.append(text)
+                    self.options.sort(key=int)
+                self.selected_index = self.options.index(text)
+                self.typed = ""
+                self.expanded = False
+                return text != old_text
+
         # If we reach here, no dropdown option was changed
         return False
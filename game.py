@@ -1,13 +1,29 @@
 # game.py
+import threading
 from maze import (
-    generate_cells,
-    select_paths,
     depth_first_search,
     breadth_first_search,
     uniform_cost_search,
     a_star_search,
     ant_colony_optimization,
     backtrack,
+    new_parents,
+    new_search_map,
+    clear_parents,
+    clear_search_map,
+    clear_solution,
+    SearchRecorder,
+    SearchCancelled,
+    apply_changes,
+    NO_PARENT,
+    SEARCHED,
+    IN_SOLUTION,
+    make_rng,
+    new_seed,
+    LEFT,
+    RIGHT,
+    TOP,
+    BOTTOM,
 )
 from config import (
     MODE_IDLE,
@@ -18,166 +34,263 @@ from config import (
     MODE_A2,
     MODE_UCS,
     MODE_ACO,
+    MODE_UCS_HEAP,
+    DEFAULT_GENERATOR,
 )
+from generators import generate_maze
+from maze_io import save_maze, load_maze
+from prefetch import MazePrefetcher
+
+
+def run_search(mode, cell_map, search_map, parents, observer=None, rng=None):
+    """Run the solver for a search mode to completion. Returns its AlgorithmStats."""
+    rows, cols = cell_map.rows, cell_map.cols
+    if mode == MODE_DFS:
+        return depth_first_search(cell_map, search_map, parents, observer)
+    if mode == MODE_BFS:
+        return breadth_first_search(cell_map, search_map, parents, observer)
+    if mode == MODE_A1 or mode == MODE_A2:
+        choice = 1 if mode == MODE_A1 else 2
+        return a_star_search(
+            cell_map, search_map, parents, rows, cols, choice, observer
+        )
+    if mode == MODE_UCS:
+        return uniform_cost_search(cell_map, search_map, parents, observer)
+    if mode == MODE_UCS_HEAP:
+        return uniform_cost_search(
+            cell_map, search_map, parents, observer, frontier="heap"
+        )
+    if mode == MODE_ACO:
+        return ant_colony_optimization(
+            cell_map, search_map, parents, rows, cols, observer, rng
+        )
+    raise ValueError(f"Not a search mode: {mode}")
+
+
+def solve(recorder, mode, cell_map, search_map, parents, rng):
+    """Run a search into a recorder; the target of start_search's worker"""
+    try:
+        stats = run_search(mode, cell_map, search_map, parents, recorder, rng)
+    except SearchCancelled:
+        recorder.finish()
+    except Exception as error:
+        recorder.finish(error=error)  # Raised again by step_search
+    else:
+        recorder.finish(stats)
 
 
 class MAZY_AI:
-    def __init__(self, rows, cols):
+    def __init__(
+        self, rows, cols, generator=DEFAULT_GENERATOR, seed=None, prefetch=False
+    ):
         self.rows = rows
         self.cols = cols
+        self.generator = generator  # Key into generators.GENERATORS
+        # Optional background builder that keeps the next mazes ready
+        self.prefetcher = MazePrefetcher() if prefetch else None
+        # Seed for the current maze and its stochastic searches
+        self.seed = new_seed() if seed is None else seed
         self.build_maze()
-        self.search_map = [
-            {"searched": False, "inSolution": False}
-            for _ in range(self.rows * self.cols)
-        ]
-        self.paths_searched = []
-        self.work_list = []
-        self.mode = MODE_IDLE
-        self.search_generator = None
+        self.search_map = None  # Allocated by clear_search, then reused
+        # Bumped whenever search_map changes other than cell by cell
+        self.search_version = 0
+        self.stats = None  # AlgorithmStats of the last search
+        self.search_run = None  # SearchRecorder being played back
+        self.solver = None  # Worker thread filling search_run
+        # (search_map, parents) the solver writes to, reused between runs
+        self.solver_buffers = None
+        self.clear_search()
         self.search_speed = 10  # Lower is slower
+        if self.prefetcher:
+            self.prefetcher.request(self.rows, self.cols, self.generator)
 
     def build_maze(self):
-        self.cell_map = generate_cells(self.rows, self.cols)
-        select_paths(self.cell_map, self.rows, self.cols)
+        self.cell_map = generate_maze(self.rows, self.cols, self.generator, self.seed)
 
-    def reset(self):
-        self.build_maze()
-        self.search_map = [
-            {"searched": False, "inSolution": False}
-            for _ in range(self.rows * self.cols)
-        ]
-        self.paths_searched = []
+    def reset(self, seed=None):
+        ready = None
+        if self.prefetcher and seed is None:
+            ready = self.prefetcher.take(self.rows, self.cols, self.generator)
+        if ready:
+            # Swap in a maze the background worker already built
+            self.seed, self.cell_map = ready
+        else:
+            self.seed = new_seed() if seed is None else seed
+            self.build_maze()
+        self.clear_search()
+
+    def save(self, path):
+        """Write the current maze to a maze file"""
+        save_maze(path, self.cell_map, self.seed, self.generator)
+
+    def load(self, path):
+        """Replace the current maze with one memory-mapped from a maze file"""
+        cell_map = load_maze(path)
+        self.rows = cell_map.rows
+        self.cols = cell_map.cols
+        self.seed = new_seed() if cell_map.seed is None else cell_map.seed
+        self.generator = cell_map.generator or self.generator
+        self.cell_map = cell_map
+        self.clear_search()
+
+    def clear_search(self):
+        self.reset_search_state()
         self.work_list = []
         self.mode = MODE_IDLE
-        self.search_generator = None
+        self.stop_search()
+
+    def stop_search(self):
+        """Stop playing back a search, and stop its solver if still running.
+
+        Waits for the solver thread to exit, so its buffers can be reused and
+        it takes no CPU time from whatever runs next.
+        """
+        if self.search_run is not None:
+            self.search_run.cancel()
+            self.search_run = None
+            self.mode = MODE_IDLE
+        if self.solver is not None:
+            self.solver.join()
+            self.solver = None
+
+    def reset_search_state(self):
+        """Clear search_map and parents, reusing them while the size is unchanged"""
+        size = self.rows * self.cols
+        self.search_version += 1
+        if self.search_map is None or len(self.search_map) != size:
+            self.search_map = new_search_map(size)
+            self.parents = new_parents(size)
+        else:
+            clear_search_map(self.search_map)
+            clear_parents(self.parents)
 
     def initialize_search(self):
-        self.work_list = [{"cell": 0, "neighbors": self.cell_map[0]}]
-        self.search_map = [
-            {"searched": False, "inSolution": False}
-            for _ in range(self.rows * self.cols)
-        ]
-        self.paths_searched = []
+        self.work_list = [0]
+        self.stop_search()
+        self.reset_search_state()
         # Mark start cell as searched but not part of solution initially
-        self.search_map[0]["searched"] = True
+        self.search_map[0] |= SEARCHED
 
     def start_search(self, mode):
+        """Start solving the maze for a mode and queue its steps for display.
+
+        The solver runs on a worker thread with a SearchRecorder attached,
+        and step_search plays the recorded cell changes back in batches as
+        they arrive, so the search shows from the first frame however long
+        solving takes. The solver writes to its own search map and parents,
+        never the ones on display.
+        """
         self.initialize_search()
         self.mode = mode
-        if mode == MODE_DFS:
-            self.search_generator = depth_first_search(
-                self.cell_map, self.search_map, self.paths_searched
-            )
-        elif mode == MODE_BFS:
-            self.search_generator = breadth_first_search(
-                self.cell_map, self.search_map, self.paths_searched
-            )
-        elif mode == MODE_A1:
-            self.search_generator = a_star_search(
-                self.cell_map,
-                self.search_map,
-                self.paths_searched,
-                self.rows,
-                self.cols,
-                1,
-            )
-        elif mode == MODE_A2:
-            self.search_generator = a_star_search(
-                self.cell_map,
-                self.search_map,
-                self.paths_searched,
-                self.rows,
-                self.cols,
-                2,
-            )
-        elif mode == MODE_UCS:
-            self.search_generator = uniform_cost_search(
-                self.cell_map, self.search_map, self.paths_searched
-            )
-        elif mode == MODE_ACO:
-            self.search_generator = ant_colony_optimization(
+        size = len(self.search_map)
+        if self.solver_buffers is None or len(self.solver_buffers[0]) != size:
+            self.solver_buffers = (new_search_map(size), new_parents(size))
+        else:
+            clear_search_map(self.solver_buffers[0])
+            clear_parents(self.solver_buffers[1])
+        search_map, parents = self.solver_buffers
+        recorder = SearchRecorder()
+        self.solver = threading.Thread(
+            target=solve,
+            args=(
+                recorder,
+                mode,
                 self.cell_map,
-                self.search_map,
-                self.paths_searched,
-                self.rows,
-                self.cols,
-            )
+                search_map,
+                parents,
+                make_rng(self.seed),
+            ),
+            daemon=True,
+        )
+        self.search_run = recorder
+        self.solver.start()
+
+    def step_search(self, max_events):
+        """Show up to max_events more changes of the running search.
+
+        Returns the batch as (cells, states) so callers know which cells
+        changed. The batch is empty while the solver is behind playback.
+        The search ends once the solver has finished and its recording is
+        used up.
+        """
+        run = self.search_run
+        cells, states = run.step(max_events)
+        apply_changes(self.search_map, cells, states)
+        if run.done:
+            self.mode = MODE_IDLE
+            self.search_run = None
+            if run.error is not None:
+                raise run.error
+            self.stats = run.stats
+        return cells, states
 
     def manual_move(self, key):
-        """Handle manual movement through the maze."""
+        """Handle manual movement through the maze.
+
+        Returns the cells whose state the move changed.
+        """
         if self.mode != MODE_MANUAL:
             # Initialize for manual mode if we weren't in it before
             self.initialize_search()
             self.mode = MODE_MANUAL
-            self.search_map[0]["searched"] = True
+            self.search_map[0] |= SEARCHED
 
         if not self.work_list:
-            return
+            return []
 
         # Get the current cell we're on
-        last_cell = self.work_list[-1]
-        last_idx = last_cell["cell"]
-        neighbors = last_cell["neighbors"]
-        exit_idx = self.rows * self.cols - 1
+        last_idx = self.work_list[-1]
+        exit_idx = self.cell_map.goal
 
         # Determine which direction to move based on key
-        moved = False
-        neighbor_idx = -1
-
-        if (key == "up" or key == "w") and neighbors.top["connection"]:
-            neighbor_idx = neighbors.top["neighborIndex"]
-            moved = True
-        elif (key == "left" or key == "a") and neighbors.left["connection"]:
-            neighbor_idx = neighbors.left["neighborIndex"]
-            moved = True
-        elif (key == "down" or key == "s") and neighbors.bottom["connection"]:
-            neighbor_idx = neighbors.bottom["neighborIndex"]
-            moved = True
-        elif (key == "right" or key == "d") and neighbors.right["connection"]:
-            neighbor_idx = neighbors.right["neighborIndex"]
-            moved = True
+        if key == "up" or key == "w":
+            direction = TOP
+        elif key == "left" or key == "a":
+            direction = LEFT
+        elif key == "down" or key == "s":
+            direction = BOTTOM
+        elif key == "right" or key == "d":
+            direction = RIGHT
         else:
-            return  # Invalid move, no connection in that direction
+            return []
+
+        if not self.cell_map.is_open(last_idx, direction):
+            return []  # Invalid move, no connection in that direction
+        neighbor_idx = self.cell_map.neighbor_index(last_idx, direction)
 
-        if moved and neighbor_idx != -1:
+        if neighbor_idx != -1:
             # Check if we're moving to a cell we've already visited
-            if self.search_map[neighbor_idx]["searched"]:
+            if self.search_map[neighbor_idx] & SEARCHED:
                 # We're backtracking - Check if it's the previous cell in our path
-                if (
-                    len(self.work_list) > 1
-                    and self.work_list[-2]["cell"] == neighbor_idx
-                ):
+                if len(self.work_list) > 1 and self.work_list[-2] == neighbor_idx:
                     # Valid backtracking - remove current cell from the work list
                     backtracked_cell = self.work_list.pop()
                     # Clear the "searched" flag for the cell we're leaving
-                    self.search_map[backtracked_cell["cell"]]["searched"] = False
-                    self.search_map[backtracked_cell["cell"]]["inSolution"] = False
-
-                    # Also remove this path from paths_searched
-                    for i in range(len(self.paths_searched) - 1, -1, -1):
-                        if self.paths_searched[i]["to"] == backtracked_cell["cell"]:
-                            self.paths_searched.pop(i)
-                            break
+                    self.search_map[backtracked_cell] = 0
+
+                    # Also forget how we reached it
+                    self.parents[backtracked_cell] = NO_PARENT
                 # If not a direct previous cell, don't allow the move
             else:
                 # We're moving to a new unvisited cell
                 # Mark it as searched (blue)
-                self.search_map[neighbor_idx]["searched"] = True
+                self.search_map[neighbor_idx] |= SEARCHED
                 # Add to our path
-                self.work_list.append(
-                    {"cell": neighbor_idx, "neighbors": self.cell_map[neighbor_idx]}
-                )
+                self.work_list.append(neighbor_idx)
                 # Track this path for potential solution reconstruction
-                self.paths_searched.append({"from": last_idx, "to": neighbor_idx})
+                self.parents[neighbor_idx] = last_idx
 
             # Check if we've reached the exit
             if neighbor_idx == exit_idx:
                 # We've reached the destination, highlight the solution path
                 # Clear all solution flags first
-                for i in range(len(self.search_map)):
-                    self.search_map[i]["inSolution"] = False
+                clear_solution(self.search_map)
 
                 # Use backtrack to highlight the path from start to exit
-                self.search_map[exit_idx]["inSolution"] = True
-                backtrack(self.search_map, self.paths_searched, exit_idx)
+                self.search_map[exit_idx] |= IN_SOLUTION
+                backtrack(self.search_map, self.parents, exit_idx)
                 self.mode = MODE_IDLE  # Done with manual mode
+                # The solution path changed too many cells to list
+                self.search_version += 1
+            return [last_idx, neighbor_idx]
+        return []
@@ -0,0 +1,305 @@
+# generators.py
+import heapq
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from maze import (
+    generate_cells,
+    select_paths,
+    build_paths,
+    make_rng,
+    make_numpy_rng,
+    DisjointSet,
+    LEFT,
+    RIGHT,
+    TOP,
+    BOTTOM,
+)
+from maze_io import write_maze
+
+GENERATORS = {}
+
+
+def register_generator(name):
+    """Decorator adding a maze generator to the registry under the given name"""
+
+    def decorator(func):
+        GENERATORS[name] = func
+        return func
+
+    return decorator
+
+
+register_generator("kruskal")(select_paths)
+
+
+def generate_maze(rows, cols, generator="kruskal", seed=None):
+    """Create a new grid and carve a perfect maze into it.
+
+    The same seed and generator always produce the same maze.
+    """
+    if generator not in GENERATORS:
+        raise ValueError(f"Unknown maze generator: {generator}")
+    cell_map = generate_cells(rows, cols)
+    GENERATORS[generator](cell_map, rows, cols, seed)
+    return cell_map
+
+
+@register_generator("prim")
+def prim(cell_map, rows, cols, rng=None):
+    """Randomized Prim's algorithm with a heap of randomly weighted walls"""
+    rng = make_rng(rng)
+    visited = bytearray(rows * cols)
+    remaining = rows * cols - 1
+    heap = []
+
+    def add_walls(idx):
+        for n_idx in cell_map.adjacent(idx):
+            if not visited[n_idx]:
+                heapq.heappush(heap, (rng.random(), idx, n_idx))
+
+    visited[0] = 1
+    add_walls(0)
+    while heap and remaining > 0:
+        _, cell_idx, n_idx = heapq.heappop(heap)
+        if visited[n_idx]:
+            continue  # Both sides are already in the maze
+        visited[n_idx] = 1
+        cell_map.connect(cell_idx, n_idx)
+        remaining -= 1
+        add_walls(n_idx)
+
+
+@register_generator("backtracker")
+def recursive_backtracker(cell_map, rows, cols, rng=None):
+    """Randomized depth-first carving using an explicit stack"""
+    rng = make_rng(rng)
+    visited = bytearray(rows * cols)
+    visited[0] = 1
+    stack = [0]
+
+    while stack:
+        cell_idx = stack[-1]
+        candidates = [n for n in cell_map.adjacent(cell_idx) if not visited[n]]
+        if not candidates:
+            stack.pop()
+            continue
+        n_idx = rng.choice(candidates)
+        cell_map.connect(cell_idx, n_idx)
+        visited[n_idx] = 1
+        stack.append(n_idx)
+
+
+@register_generator("wilson")
+def wilson(cell_map, rows, cols, rng=None):
+    """Wilson's algorithm: loop-erased random walks give a uniform spanning tree"""
+    rng = make_rng(rng)
+    size = rows * cols
+    in_maze = bytearray(size)
+    in_maze[rng.randrange(size)] = 1
+    # Last exit taken from each cell during the current walk. Overwriting it
+    # when the walk revisits a cell is what erases the loops.
+    next_cell = array("i", [-1]) * size
+
+    for start in range(size):
+        if in_maze[start]:
+            continue
+        idx = start
+        while not in_maze[idx]:
+            n_idx = rng.choice(cell_map.adjacent(idx))
+            next_cell[idx] = n_idx
+            idx = n_idx
+
+        idx = start
+        while not in_maze[idx]:
+            in_maze[idx] = 1
+            cell_map.connect(idx, next_cell[idx])
+            idx = next_cell[idx]
+
+
+def eller_rows(rows, cols, rng=None):
+    """Eller's algorithm as a stream: yields each row's connection masks in turn.
+
+    Only the current row's set labels are kept, so memory is O(cols) no matter
+    how many rows are generated.
+    """
+    rng = make_rng(rng)
+    row_sets = [0] * cols  # Set id of each cell in the current row, 0 for none
+    above = bytearray(cols)  # Cells with a passage up into the previous row
+    next_set = 1
+
+    for row in range(rows):
+        masks = bytearray(cols)
+        last_row = row == rows - 1
+
+        # Cells without a passage from above start their own set
+        members = {}
+        for col in range(cols):
+            if above[col]:
+                masks[col] = TOP
+            if row_sets[col] == 0:
+                row_sets[col] = next_set
+                next_set += 1
+            members.setdefault(row_sets[col], []).append(col)
+
+        # Randomly join horizontally adjacent cells from different sets. The
+        # last row must join everything left over.
+        for col in range(cols - 1):
+            left_set = row_sets[col]
+            right_set = row_sets[col + 1]
+            if left_set != right_set and (last_row or rng.random() < 0.5):
+                masks[col] |= RIGHT
+                masks[col + 1] |= LEFT
+                # Relabel the smaller set into the larger one
+                if len(members[left_set]) < len(members[right_set]):
+                    left_set, right_set = right_set, left_set
+                for c in members[right_set]:
+                    row_sets[c] = left_set
+                members[left_set].extend(members.pop(right_set))
+
+        if last_row:
+            yield masks
+            break
+
+        # Every set extends down at least once so it stays connected
+        below = [0] * cols
+        above = bytearray(cols)
+        for set_id, cols_in_set in members.items():
+            forced = rng.choice(cols_in_set)
+            for col in cols_in_set:
+                if col == forced or rng.random() < 0.5:
+                    masks[col] |= BOTTOM
+                    above[col] = 1
+                    below[col] = set_id
+        row_sets = below
+        yield masks
+
+
+@register_generator("eller")
+def eller(cell_map, rows, cols, rng=None):
+    """Eller's algorithm, filling the grid from the row stream"""
+    fill_rows(cell_map, eller_rows(rows, cols, rng))
+
+
+TILE_SIZE = 512  # Side of the square tiles used by tiled_kruskal
+
+
+def _build_tile(task):
+    """Worker: Kruskal spanning tree for one tile, returned as raw masks"""
+    tile_rows, tile_cols, seed = task
+    tile = generate_cells(tile_rows, tile_cols)
+    select_paths(tile, tile_rows, tile_cols, seed)
+    return bytes(tile.cells)
+
+
+@register_generator("tiled")
+def tiled_kruskal(cell_map, rows, cols, rng=None, tile_size=TILE_SIZE, workers=None):
+    """Kruskal on independent tiles in a process pool, stitched into one maze.
+
+    Each tile is a spanning tree of its own cells, so a tile can stand for a
+    single node in the stitching union-find. Opening shuffled border walls
+    between tiles that are not yet joined then gives a perfect maze overall.
+    The result for a seed does not depend on the number of workers.
+    """
+    rng = make_rng(rng)
+    tiles_down = -(-rows // tile_size)
+    tiles_across = -(-cols // tile_size)
+    tasks = []
+    for tile_row in range(tiles_down):
+        for tile_col in range(tiles_across):
+            tile_rows = min(tile_size, rows - tile_row * tile_size)
+            tile_cols = min(tile_size, cols - tile_col * tile_size)
+            tasks.append((tile_rows, tile_cols, rng.getrandbits(64)))
+
+    cells = np.frombuffer(cell_map.cells, dtype=np.uint8).reshape(rows, cols)
+    if len(tasks) == 1 or workers == 1:
+        results = map(_build_tile, tasks)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(workers)
+        results = pool.map(_build_tile, tasks)
+    try:
+        for t, masks in enumerate(results):
+            tile_row, tile_col = divmod(t, tiles_across)
+            tile_rows, tile_cols, _ = tasks[t]
+            top = tile_row * tile_size
+            left = tile_col * tile_size
+            cells[top : top + tile_rows, left : left + tile_cols] = np.frombuffer(
+                masks, dtype=np.uint8
+            ).reshape(tile_rows, tile_cols)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    # Walls on tile borders: right edges of each tile column boundary and
+    # bottom edges of each tile row boundary, indexed without a full-grid array
+    border_cols = np.arange(tile_size - 1, cols - 1, tile_size, dtype=np.int32)
+    border_rows = np.arange(tile_size - 1, rows - 1, tile_size, dtype=np.int32)
+    across = (np.arange(rows, dtype=np.int32)[:, None] * cols + border_cols).ravel()
+    down = (border_rows[:, None] * cols + np.arange(cols, dtype=np.int32)).ravel()
+    cell1 = np.concatenate((across, down))
+    cell2 = np.concatenate((across + 1, down + cols))
+    order = make_numpy_rng(rng).permutation(len(cell1))
+    cell1 = cell1[order]
+    cell2 = cell2[order]
+
+    # Tile id of every border cell, as plain ints for the union-find loop
+    def tile_ids(cell):
+        return (cell // cols // tile_size) * tiles_across + cell % cols // tile_size
+
+    tiles1 = tile_ids(cell1)
+    tiles2 = tile_ids(cell2)
+    sets = DisjointSet(len(tasks))
+    remaining = len(tasks) - 1
+    selected = array("i")
+    for cursor, (a, b) in enumerate(zip(memoryview(tiles1), memoryview(tiles2))):
+        if remaining == 0:
+            break
+        if sets.union(a, b):
+            selected.append(cursor)
+            remaining -= 1
+
+    selected = np.frombuffer(selected, dtype=np.int32)
+    build_paths(cell_map, cell1[selected], cell2[selected])
+
+
+def fill_rows(cell_map, row_stream):
+    """Copy streamed rows of connection masks into a grid, top to bottom"""
+    cols = cell_map.cols
+    for row, masks in enumerate(row_stream):
+        cell_map.cells[row * cols : (row + 1) * cols] = masks
+
+
+def benchmark_generator(generator, rows, cols, repeats=3):
+    """Best throughput of a generator in cells per second over a few runs"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        generate_maze(rows, cols, generator)
+        best = min(best, time.perf_counter() - start)
+    return rows * cols / best
+
+
+def benchmark_generators(sizes=(20, 50, 200), repeats=3):
+    """Print cells per second for every registered generator at each size"""
+    print(f"{'Generator':<12}" + "".join(f"{f'{n}x{n}':>14}" for n in sizes))
+    for name in GENERATORS:
+        results = [benchmark_generator(name, n, n, repeats) for n in sizes]
+        print(f"{name:<12}" + "".join(f"{r:>14,.0f}" for r in results))
+
+
+if __name__ == "__main__":
+    # Usage: python generators.py [size ...]
+    #        python generators.py --stream ROWS COLS OUTPUT_FILE [SEED]
+    if sys.argv[1:2] == ["--stream"]:
+        rows, cols, output = int(sys.argv[2]), int(sys.argv[3]), sys.argv[4]
+        seed = int(sys.argv[5]) if len(sys.argv) > 5 else None
+        start = time.perf_counter()
+        write_maze(output, rows, cols, eller_rows(rows, cols, seed), seed, "eller")
+        elapsed = time.perf_counter() - start
+        print(f"Wrote {rows}x{cols} maze to {output} in {elapsed:.2f}s")
+    else:
+        sizes = tuple(int(arg) for arg in sys.argv[1:]) or (20, 50, 200)
+        benchmark_generators(sizes)
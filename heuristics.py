@@ -0,0 +1,155 @@
+# heuristics.py
+import threading
+from array import array
+from collections import OrderedDict
+import numpy as np
+
+MAX_CACHED_BYTES = 64 << 20  # Bytes of tables kept across all cached shapes
+
+
+class HeuristicTables:
+    """Per-cell heuristic values for one maze shape and goal, as flat arrays.
+
+    manhattan[idx] is the Manhattan distance from idx to the goal. eta_power
+    gives the ACO desirability (1 / (distance + 1)) ** beta of every cell,
+    tabulated per beta while the owning cache has room for it.
+    """
+
+    def __init__(self, rows, cols, goal, cache=None):
+        self.size = rows * cols
+        self.cache = cache  # HeuristicCache budgeting these tables, if any
+        goal_row, goal_col = divmod(goal, cols)
+        distance = (
+            np.abs(np.arange(rows, dtype=np.int32) - goal_row)[:, None]
+            + np.abs(np.arange(cols, dtype=np.int32) - goal_col)[None, :]
+        ).ravel()
+        # array.array indexing hands back plain ints, much faster than numpy's
+        self.manhattan = array("i", distance.tobytes())
+        self._eta = {}
+        self.nbytes = self.manhattan.itemsize * self.size
+
+    def eta_power(self, beta):
+        table = self._eta.get(beta)
+        if table is not None:
+            return table
+        nbytes = array("d").itemsize * self.size
+        cache = self.cache  # Read once; another thread may evict these tables
+        if cache is not None and not cache.reserve(self, nbytes):
+            return EtaView(self.manhattan, beta)  # No room to tabulate it
+        # Computed from a zero-copy view of manhattan, so no second copy of
+        # the distances is kept
+        distance = np.frombuffer(self.manhattan, dtype=np.int32)
+        table = array("d", ((1.0 / (distance + 1.0)) ** beta).tobytes())
+        self._eta[beta] = table
+        self.nbytes += nbytes
+        return table
+
+
+class ManhattanView:
+    """Manhattan distances computed on access, for mazes too large to tabulate"""
+
+    def __init__(self, cols, goal):
+        self.cols = cols
+        self.goal_row, self.goal_col = divmod(goal, cols)
+
+    def __getitem__(self, idx):
+        row, col = divmod(idx, self.cols)
+        return abs(self.goal_row - row) + abs(self.goal_col - col)
+
+
+class EtaView:
+    """ACO desirability computed on access, matching HeuristicTables.eta_power"""
+
+    def __init__(self, manhattan, beta):
+        self.manhattan = manhattan
+        self.beta = beta
+
+    def __getitem__(self, idx):
+        return (1.0 / (self.manhattan[idx] + 1)) ** self.beta
+
+
+class LazyHeuristics:
+    """Same interface as HeuristicTables without allocating anything per cell"""
+
+    def __init__(self, cols, goal):
+        self.manhattan = ManhattanView(cols, goal)
+
+    def eta_power(self, beta):
+        return EtaView(self.manhattan, beta)
+
+
+class HeuristicCache:
+    """LRU cache of HeuristicTables keyed by (rows, cols, goal).
+
+    Every stored table, distances and desirabilities alike, counts against
+    max_bytes. Tables are dropped least recently used first once they hold
+    more than that in total. Shapes whose distances alone would not fit get
+    LazyHeuristics, and desirabilities that would not fit are computed on
+    access instead of tabulated. Searches running on worker threads share
+    it, so it is locked.
+    """
+
+    def __init__(self, max_bytes=MAX_CACHED_BYTES):
+        self.max_bytes = max_bytes
+        self.tables = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    def get(self, rows, cols, goal):
+        if rows * cols * array("i").itemsize > self.max_bytes:
+            return LazyHeuristics(cols, goal)
+        with self.lock:
+            return self._get(rows, cols, goal)
+
+    def _get(self, rows, cols, goal):
+        key = (rows, cols, goal)
+        tables = self.tables.get(key)
+        if tables is not None:
+            self.hits += 1
+            self.tables.move_to_end(key)
+            return tables
+        self.misses += 1
+        tables = HeuristicTables(rows, cols, goal, self)
+        self.tables[key] = tables
+        self.nbytes += tables.nbytes
+        self.evict(tables)
+        return tables
+
+    def reserve(self, tables, nbytes):
+        """Make room for nbytes more in tables; False if it can't fit"""
+        with self.lock:
+            if tables.cache is not self:
+                return True  # Evicted while the caller held it; not budgeted
+            if tables.nbytes + nbytes > self.max_bytes:
+                return False
+            self.nbytes += nbytes
+            self.evict(tables)
+            return True
+
+    def evict(self, keep):
+        """Drop least recently used tables other than keep until under budget"""
+        for key in list(self.tables):
+            if self.nbytes <= self.max_bytes:
+                break
+            if self.tables[key] is not keep:
+                evicted = self.tables.pop(key)
+                # A search may still hold it; it is no longer budgeted here
+                evicted.cache = None
+                self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        with self.lock:
+            for tables in self.tables.values():
+                tables.cache = None
+            self.tables.clear()
+            self.nbytes = 0
+
+
+HEURISTICS = HeuristicCache()
+
+
+def heuristic_tables(rows, cols, goal):
+    """Shared heuristic tables for a maze shape and goal"""
+    return HEURISTICS.get(rows, cols, goal)
@@ -0,0 +1,151 @@
+# infinite_maze.py
+import random
+from collections import OrderedDict
+from maze import (
+    MazeGrid,
+    generate_cells,
+    select_paths,
+    SparseArray,
+    LEFT,
+    RIGHT,
+    TOP,
+    BOTTOM,
+)
+
+
+class InfiniteMaze:
+    """An effectively unbounded perfect maze generated one tile at a time.
+
+    Cells are indexed row * cols + col like MazeGrid, and neighbors(idx) has
+    the same contract, so the searches in maze.py run on it unchanged. Only
+    the tiles a search or the renderer touches are built, and at most
+    cache_tiles of them are kept (least recently used are evicted).
+
+    Each tile is a Kruskal spanning tree seeded from (seed, tile row, tile
+    column), so any tile can be rebuilt identically at any time. Tiles are
+    stitched with a binary-tree rule: every tile opens exactly one wall into
+    the tile above or the tile to its left (the first row always goes left,
+    the first column always goes up). The tiles then form a spanning tree too,
+    which keeps the whole maze perfect without any global state.
+
+    The goal defaults to the far corner of the first tile, because a search
+    costs time in the cells it explores and the maze's own far corner is
+    millions of cells away. Pass goal for any other exit. DFS may still
+    wander off indefinitely, since a branch of an unbounded maze can be
+    unbounded too; BFS, A* and UCS only explore around the goal's distance.
+    """
+
+    def __init__(self, seed=0, tile_size=64, tiles=1 << 16, goal=None, cache_tiles=256):
+        self.seed = seed
+        self.tile_size = tile_size
+        self.tiles_per_side = tiles
+        self.rows = tiles * tile_size
+        self.cols = tiles * tile_size
+        self.size = self.rows * self.cols
+        if goal is None:
+            goal = self.cell_index(tile_size - 1, tile_size - 1)
+        self.goal = goal
+        self.cache_tiles = cache_tiles
+        self.tiles = OrderedDict()  # (tile row, tile col) -> bytearray of masks
+        self.tiles_built = 0
+        self.cells = InfiniteCells(self)
+        self.offsets = {LEFT: -1, RIGHT: 1, TOP: -self.cols, BOTTOM: self.cols}
+        self._step_tables = {}
+
+    def __len__(self):
+        return self.size
+
+    def cell_index(self, row, col):
+        return row * self.cols + col
+
+    def _tile_rng(self, tile_row, tile_col, purpose):
+        return random.Random(f"{self.seed}:{tile_row}:{tile_col}:{purpose}")
+
+    def _border(self, tile_row, tile_col):
+        """Which wall a tile opens into its upper or left neighbor, and where.
+
+        Returns (direction, offset along the border), or None for tile (0, 0).
+        """
+        if tile_row == 0 and tile_col == 0:
+            return None
+        rng = self._tile_rng(tile_row, tile_col, "border")
+        if tile_row == 0:
+            direction = LEFT
+        elif tile_col == 0:
+            direction = TOP
+        else:
+            direction = rng.choice((TOP, LEFT))
+        return direction, rng.randrange(self.tile_size)
+
+    def _build_tile(self, tile_row, tile_col):
+        size = self.tile_size
+        tile = generate_cells(size, size)
+        select_paths(tile, size, size, self._tile_rng(tile_row, tile_col, "tile"))
+        cells = tile.cells
+
+        # This tile's own opening upward or to the left
+        border = self._border(tile_row, tile_col)
+        if border:
+            direction, offset = border
+            cells[offset if direction == TOP else offset * size] |= direction
+
+        # Openings the tiles below and to the right make into this one
+        if tile_row + 1 < self.tiles_per_side:
+            direction, offset = self._border(tile_row + 1, tile_col)
+            if direction == TOP:
+                cells[(size - 1) * size + offset] |= BOTTOM
+        if tile_col + 1 < self.tiles_per_side:
+            direction, offset = self._border(tile_row, tile_col + 1)
+            if direction == LEFT:
+                cells[offset * size + size - 1] |= RIGHT
+        return cells
+
+    def tile(self, tile_row, tile_col):
+        """Connection masks of one tile, building it on first use"""
+        key = (tile_row, tile_col)
+        cells = self.tiles.get(key)
+        if cells is not None:
+            self.tiles.move_to_end(key)
+            return cells
+        cells = self._build_tile(tile_row, tile_col)
+        self.tiles_built += 1
+        self.tiles[key] = cells
+        if len(self.tiles) > self.cache_tiles:
+            self.tiles.popitem(last=False)
+        return cells
+
+    def mask(self, idx):
+        row, col = divmod(idx, self.cols)
+        size = self.tile_size
+        tile = self.tile(row // size, col // size)
+        return tile[(row % size) * size + col % size]
+
+    def is_open(self, idx, direction):
+        return bool(self.mask(idx) & direction)
+
+    # Same contract and step tables as MazeGrid; self.cells reads tile masks
+    neighbors = MazeGrid.neighbors
+
+
+class InfiniteCells:
+    """Index view so code reading MazeGrid.cells[idx] also works on InfiniteMaze"""
+
+    def __init__(self, maze):
+        self.maze = maze
+
+    def __len__(self):
+        return self.maze.size
+
+    def __getitem__(self, idx):
+        return self.maze.mask(idx)
+
+
+class SparseSearchMap(dict):
+    """search_map for unbounded mazes: only touched cells take up memory"""
+
+    def __missing__(self, idx):
+        return 0
+
+
+class SparseParents(SparseArray):
+    """Parent array for unbounded mazes: only reached cells take up memory"""
@@ -11,31 +11,58 @@ from config import (
     SMALL_FONT,
     ROW_OPTIONS,
     COL_OPTIONS,
+    MIN_MAZE_SIDE,
+    MAX_MAZE_SIDE,
+    MAX_SEARCH_SPEED,
+    IDLE_WAIT_MS,
+    MODE_MANUAL,
+    get_font,
 )
+from camera import Camera, ZOOM_STEP
 from dropdown import Dropdown
 from game import MAZY_AI
-from ui_components import draw_maze, draw_scrollbar, draw_button
-from algorithm_comparison import compare_algorithms, show_comparison_screen
-
-pygame.init()
-# Start in fullscreen mode
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-WINDOW_WIDTH, WINDOW_HEIGHT = screen.get_size()
-pygame.display.set_caption("MAZY AI")
+from minimap import Minimap
+from ui_components import (
+    draw_maze,
+    draw_scrollbar,
+    draw_button,
+    vertical_gradient,
+    render_text,
+)
+from algorithm_comparison import run_comparison, show_comparison_screen
+
+# The window is opened by main(), so worker processes that import this
+# module (maze prefetching, where processes are spawned) don't open one
+screen = None
 clock = pygame.time.Clock()
 
 
 def main():
     global WINDOW_WIDTH, WINDOW_HEIGHT, screen
+    pygame.init()
+    # Start in fullscreen mode
+    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    WINDOW_WIDTH, WINDOW_HEIGHT = screen.get_size()
+    pygame.display.set_caption("MAZY AI")
+
     scroll_y = 0
     max_scroll_y = 0
     running = True
     dragging_scrollbar = False
+    dragging_maze = False
+    dragging_minimap = False
     comparison_active = False
     comparison_results = None
+    dirty = True  # Whether the screen needs drawing again
+    layout_size = None  # Window size the sidebar was last laid out for
+    hover_target = None  # What the pointer was over when last drawn
 
     # Create a default game with 20x20
-    game = MAZY_AI(ROW_OPTIONS[2], COL_OPTIONS[2])
+    game = MAZY_AI(ROW_OPTIONS[2], COL_OPTIONS[2], prefetch=True)
+    # Zoom and pan over the maze; the viewport is laid out every frame
+    camera = Camera(game.rows, game.cols)
+    # Overview of large mazes; clicking it moves the camera
+    minimap = Minimap(camera)
 
     # Create smaller dropdowns for Rows and Cols
     dropdown_width = 70  # Smaller width
@@ -43,7 +70,7 @@ def main():
     dropdown_gap = 30
 
     # Create small font for dropdown
-    small_dropdown_font = pygame.font.SysFont("Arial", 16)
+    small_dropdown_font = get_font("Arial", 16)
 
     # Create dropdowns with side-by-side positioning
     row_dropdown = Dropdown(
@@ -55,7 +82,8 @@ def main():
         options=[str(r) for r in ROW_OPTIONS],
         selected_index=2,
         z_index=10,
-        dropdown_direction="up",  # Make the dropdown expand upward
+        dropdown_direction="down",  # Drawn over the buttons below it
+        value_range=(MIN_MAZE_SIDE, MAX_MAZE_SIDE),
     )
 
     col_dropdown = Dropdown(
@@ -67,7 +95,8 @@ def main():
         options=[str(c) for c in COL_OPTIONS],
         selected_index=2,
         z_index=10,
-        dropdown_direction="up",  # Make the dropdown expand upward
+        dropdown_direction="down",  # Drawn over the buttons below it
+        value_range=(MIN_MAZE_SIDE, MAX_MAZE_SIDE),
     )
 
     # Algorithm buttons
@@ -114,77 +143,138 @@ def main():
         # Handle comparison view if active
         if comparison_active:
             if comparison_results is None:
-                # Run the comparison
-                comparison_results = compare_algorithms(game)
+                # Stop a running search first, its solver would skew the timings
+                game.stop_search()
+                comparison_results = run_comparison(screen, game)
+                if comparison_results is None:
+                    # Cancelled; a QUIT is handled by the main loop below
+                    comparison_active = False
+                    screen = pygame.display.get_surface()
+                    dirty = True
+                    continue
 
             # Show the comparison screen
-            show_comparison_screen(screen, comparison_results, return_from_comparison)
+            show_comparison_screen(
+                screen, comparison_results, return_from_comparison, minimap
+            )
             comparison_active = False
             comparison_results = None
+            # The comparison screen may have resized the window
+            screen = pygame.display.get_surface()
+            dirty = True
             continue
 
-        # Recalculate dynamic values for screen size
-        WINDOW_WIDTH, WINDOW_HEIGHT = screen.get_size()
+        # Lay the sidebar out again only when the window size changed
+        if screen.get_size() != layout_size:
+            layout_size = screen.get_size()
+            WINDOW_WIDTH, WINDOW_HEIGHT = layout_size
+            dirty = True
+
+            # Update dropdown positions
+            row_dropdown.rect.x = WINDOW_WIDTH - 2 * dropdown_width - dropdown_gap - 50
+            col_dropdown.rect.x = WINDOW_WIDTH - dropdown_width - 50
+
+            # Calculate button positions and sizes
+            button_width = 220
+            button_height = 40
+            button_gap = 15
+            sidebar_x = WINDOW_WIDTH - button_width - 50
+
+            # Position algorithm buttons
+            buttons = []
+            by = 210  # Start buttons further down to avoid dropdown conflicts
+            for text, mode in button_data:
+                buttons.append(
+                    (
+                        pygame.Rect(sidebar_x, by, button_width, button_height),
+                        text,
+                        mode,
+                    )
+                )
+                by += button_height + button_gap
+
+            # Position speed buttons side by side
+            speed_button_width = button_width // 2 - 5
+            speed_buttons_rects = []
+            for i, (text, change) in enumerate(speed_buttons):
+                x_pos = sidebar_x + (i * (speed_button_width + 10))
+                speed_buttons_rects.append(
+                    (
+                        pygame.Rect(x_pos, by, speed_button_width, button_height),
+                        text,
+                        change,
+                    )
+                )
+            by += button_height + button_gap
 
-        # Update dropdown positions
-        row_dropdown.rect.x = WINDOW_WIDTH - 2 * dropdown_width - dropdown_gap - 50
-        col_dropdown.rect.x = WINDOW_WIDTH - dropdown_width - 50
+            # Position control buttons side by side
+            control_buttons_rects = []
+            for i, (text, action) in enumerate(control_buttons):
+                x_pos = sidebar_x + (i * (speed_button_width + 10))
+                control_buttons_rects.append(
+                    (
+                        pygame.Rect(x_pos, by, speed_button_width, button_height),
+                        text,
+                        action,
+                    )
+                )
+            sidebar_rects = [
+                rect
+                for rect, _, _ in buttons + speed_buttons_rects + control_buttons_rects
+            ]
 
-        # Calculate max scroll based on content
-        content_height = max(WINDOW_HEIGHT, 700 + game.rows * 20)
+        # Calculate max scroll based on the sidebar; the maze itself pans
+        content_height = max(WINDOW_HEIGHT, by + 2 * button_height + 100)
         max_scroll_y = max(0, content_height - WINDOW_HEIGHT)
         if scroll_y > max_scroll_y:
             scroll_y = max_scroll_y
 
-        # Calculate button positions and sizes
-        button_width = 220
-        button_height = 40
-        button_gap = 15
-        sidebar_x = WINDOW_WIDTH - button_width - 50
-
-        # Position algorithm buttons
-        buttons = []
-        by = 210  # Start buttons further down to avoid dropdown conflicts
-        for text, mode in button_data:
-            buttons.append(
-                (pygame.Rect(sidebar_x, by, button_width, button_height), text, mode)
-            )
-            by += button_height + button_gap
-
-        # Position speed buttons side by side
-        speed_button_width = button_width // 2 - 5
-        speed_buttons_rects = []
-        for i, (text, change) in enumerate(speed_buttons):
-            x_pos = sidebar_x + (i * (speed_button_width + 10))
-            speed_buttons_rects.append(
-                (
-                    pygame.Rect(x_pos, by, speed_button_width, button_height),
-                    text,
-                    change,
-                )
-            )
-        by += button_height + button_gap
+        # Calculate maze area dimensions
+        header_height = 80
+        margin_left = 50
+        margin_top = header_height + 30
+        sidebar_width = 300
+        available_w = WINDOW_WIDTH - margin_left - sidebar_width
+        available_h = WINDOW_HEIGHT - margin_top - 80  # Leave room for footer
+        camera.set_viewport(
+            (margin_left, margin_top - scroll_y, available_w, available_h)
+        )
 
-        # Position control buttons side by side
-        control_buttons_rects = []
-        for i, (text, action) in enumerate(control_buttons):
-            x_pos = sidebar_x + (i * (speed_button_width + 10))
-            control_buttons_rects.append(
-                (
-                    pygame.Rect(x_pos, by, speed_button_width, button_height),
-                    text,
-                    action,
-                )
-            )
+        # While nothing is animating, sleep until there is input to handle
+        if dirty or game.search_run is not None:
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            events = pygame.event.get()
+            if event.type != pygame.NOEVENT:
+                events.insert(0, event)
 
         # Handle events
-        for event in pygame.event.get():
+        for event in events:
+            if event.type != pygame.MOUSEMOTION:
+                dirty = True  # Pointer motion only matters while dragging
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
 
+                # Typed maze sizes go to an expanded size dropdown
+                if row_dropdown.handle_event(event):
+                    game.rows = int(row_dropdown.options[row_dropdown.selected_index])
+                    game.reset()
+                elif col_dropdown.handle_event(event):
+                    game.cols = int(col_dropdown.options[col_dropdown.selected_index])
+                    game.reset()
+
+                # Zoom with +/-, Home fits the whole maze again
+                if event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                    camera.zoom(ZOOM_STEP)
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    camera.zoom(1 / ZOOM_STEP)
+                elif event.key == pygame.K_HOME:
+                    camera.fit()
+
                 key_map = {
                     pygame.K_UP: "up",
                     pygame.K_w: "w",
@@ -196,7 +286,12 @@ def main():
                     pygame.K_d: "d",
                 }
                 if event.key in key_map:
-                    game.manual_move(key_map[event.key])
+                    changed = game.manual_move(key_map[event.key])
+                    minimap.sync(game.cell_map, game.search_map, game.search_version)
+                    minimap.update(changed)
+                    if game.mode == MODE_MANUAL and game.work_list:
+                        # Keep the player in view when zoomed in
+                        camera.show_cell(*divmod(game.work_list[-1], game.cols))
             elif event.type == pygame.VIDEORESIZE:
                 if not pygame.display.get_surface().get_flags() & pygame.FULLSCREEN:
                     WINDOW_WIDTH, WINDOW_HEIGHT = event.w, event.h
@@ -213,17 +308,28 @@ def main():
                         dragging_scrollbar = True
                     else:
                         # Handle dropdown events (check these first due to higher z-index)
+                        was_expanded = row_dropdown.expanded or col_dropdown.expanded
                         changed_row = row_dropdown.handle_event(event, scroll_y)
                         changed_col = col_dropdown.handle_event(event, scroll_y)
 
                         if changed_row:
-                            new_rows = ROW_OPTIONS[row_dropdown.selected_index]
+                            new_rows = int(
+                                row_dropdown.options[row_dropdown.selected_index]
+                            )
                             game.rows = new_rows
                             game.reset()
                         elif changed_col:
-                            new_cols = COL_OPTIONS[col_dropdown.selected_index]
+                            new_cols = int(
+                                col_dropdown.options[col_dropdown.selected_index]
+                            )
                             game.cols = new_cols
                             game.reset()
+                        elif was_expanded:
+                            pass  # The click only closed an open dropdown
+                        elif minimap.handle_click((mx, my)):
+                            dragging_minimap = True  # Drag to keep moving
+                        elif camera.viewport.collidepoint(mx, my):
+                            dragging_maze = True  # Drag the maze to pan
                         else:
                             # Check algorithm buttons
                             for rect, text, mode in buttons:
@@ -251,7 +357,7 @@ def main():
                                         )
                                     else:
                                         game.search_speed = min(
-                                            60, game.search_speed * 2
+                                            MAX_SEARCH_SPEED, game.search_speed * 2
                                         )
 
                             # Check control buttons
@@ -279,6 +385,10 @@ def main():
                                     elif action == "exit":
                                         running = False
 
+                elif event.button in (4, 5) and camera.viewport.collidepoint(event.pos):
+                    # Mouse wheel over the maze zooms around the pointer
+                    factor = ZOOM_STEP if event.button == 4 else 1 / ZOOM_STEP
+                    camera.zoom(factor, event.pos)
                 elif event.button == 4:  # Mouse wheel up
                     scroll_y = max(0, scroll_y - 30)
                 elif event.button == 5:  # Mouse wheel down
@@ -287,39 +397,71 @@ def main():
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1:
                     dragging_scrollbar = False
+                    dragging_maze = False
+                    dragging_minimap = False
 
             elif event.type == pygame.MOUSEMOTION:
-                if dragging_scrollbar:
+                dirty = dirty or dragging_minimap or dragging_maze
+                dirty = dirty or dragging_scrollbar
+                if dragging_minimap:
+                    minimap.handle_click(event.pos)
+                elif dragging_maze:
+                    camera.pan(*event.rel)
+                elif dragging_scrollbar:
                     _, my = event.pos
                     if max_scroll_y > 0:  # Prevent division by zero
                         scroll_ratio = my / WINDOW_HEIGHT
                         scroll_y = int(scroll_ratio * max_scroll_y)
                         scroll_y = max(0, min(max_scroll_y, scroll_y))
 
+        # Catch the camera up with a new maze size or scroll position before
+        # drawing, or its view would still cover the old maze
+        camera.set_viewport(
+            (margin_left, margin_top - scroll_y, available_w, available_h)
+        )
+        camera.set_maze(game.rows, game.cols)
+
         # Update automated search algorithms
-        if game.mode in [1, 2, 4, 5, 6, 7] and game.search_generator:
-            for _ in range(game.search_speed):
-                try:
-                    next(game.search_generator)
-                except StopIteration:
-                    game.mode = 0
-                    game.search_generator = None
-                    break
-
-        # Draw gradient background
-        for y in range(WINDOW_HEIGHT):
-            # Calculate color for this row (linear interpolation)
-            ratio = y / WINDOW_HEIGHT
-            r = int(200 * (1 - ratio) + 180 * ratio)
-            g = int(215 * (1 - ratio) + 195 * ratio)
-            b = int(230 * (1 - ratio) + 210 * ratio)
-            color = (r, g, b)
-
-            # Draw horizontal line with this color
-            pygame.draw.line(screen, color, (0, y), (WINDOW_WIDTH, y))
+        minimap.sync(game.cell_map, game.search_map, game.search_version)
+        if game.search_run is not None:
+            cells, _ = game.step_search(game.search_speed)
+            minimap.update(cells)
+            # Batches are empty while the solver thread is behind playback
+            dirty = dirty or len(cells) > 0 or game.search_run is None
+
+        # Redraw when the pointer moves onto another button, or anywhere
+        # over an open dropdown list since its options highlight too
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        if row_dropdown.expanded or col_dropdown.expanded:
+            hovered = (mouse_x, mouse_y)
+        else:
+            hovered = next(
+                (
+                    rect
+                    for rect in sidebar_rects
+                    if rect.collidepoint(mouse_x, mouse_y + scroll_y)
+                ),
+                None,
+            )
+        if hovered != hover_target:
+            hover_target = hovered
+            dirty = True
+
+        # Nothing on screen changed since the last frame
+        if not dirty:
+            clock.tick(60)
+            continue
+        dirty = False
+
+        # Draw gradient background, rendered once per window size
+        screen.blit(
+            vertical_gradient(
+                (WINDOW_WIDTH, WINDOW_HEIGHT), (200, 215, 230), (180, 195, 210)
+            ),
+            (0, 0),
+        )
 
         # Draw header with gradient effect
-        header_height = 80
         pygame.draw.rect(
             screen, theme["header_bg"], (0, 0, WINDOW_WIDTH, header_height)
         )
@@ -330,25 +472,20 @@ def main():
         )
 
         # Draw title with shadow effect
-        title_surf = pygame.font.SysFont("Arial", 48, bold=True).render(
-            "MAZY AI", True, WHITE
+        title_surf = render_text(
+            get_font("Arial", 48, bold=True), "MAZY AI", True, WHITE
         )
         shadow_offset = 2
-        shadow_surf = pygame.font.SysFont("Arial", 48, bold=True).render(
-            "MAZY AI", True, (20, 30, 40)
+        shadow_surf = render_text(
+            get_font("Arial", 48, bold=True), "MAZY AI", True, (20, 30, 40)
         )
         screen.blit(shadow_surf, (25 + shadow_offset, 15 + shadow_offset))
         screen.blit(title_surf, (25, 15))
 
-        # Calculate maze area dimensions
-        margin_left = 50
-        margin_top = header_height + 30
-        sidebar_width = 300
-        available_w = WINDOW_WIDTH - margin_left - sidebar_width
-        available_h = WINDOW_HEIGHT - margin_top - 80  # Leave room for footer
-        cell_size = min(available_w // game.cols, available_h // game.rows)
-        maze_width = cell_size * game.cols
-        maze_height = cell_size * game.rows
+        # The part of the maze that fits the viewport at the current zoom
+        cell_size = camera.cell_size
+        maze_width = min(available_w, round(cell_size * game.cols))
+        maze_height = min(available_h, round(cell_size * game.rows))
 
         # Draw maze background and border
         maze_bg = pygame.Rect(
@@ -360,30 +497,46 @@ def main():
         pygame.draw.rect(screen, (220, 230, 240), maze_bg, border_radius=10)
         pygame.draw.rect(screen, (100, 120, 140), maze_bg, width=3, border_radius=10)
 
-        # Draw maze
+        # Draw the cells in view, clipped to the maze area and its border
+        x_off, y_off = camera.origin()
+        screen.set_clip(
+            pygame.Rect(
+                margin_left - 2,
+                margin_top - scroll_y - 2,
+                maze_width + 4,
+                maze_height + 4,
+            )
+        )
         draw_maze(
             screen,
             game.cell_map,
             game.search_map,
             game.rows,
             game.cols,
-            margin_left,
-            margin_top - scroll_y,
+            x_off,
+            y_off,
             cell_size,
+            view=camera.visible_cells(),
         )
+        screen.set_clip(None)
+
+        # Minimap in the maze's top-right corner while part of it is hidden
+        if camera.visible_cells() != (0, game.rows, 0, game.cols):
+            minimap_w, _ = minimap.size_for()
+            minimap.draw(
+                screen,
+                margin_left + maze_width - minimap_w - 10,
+                margin_top - scroll_y + 10,
+            )
+        else:
+            minimap.rect = None  # Hidden, so clicks go to the maze
 
         # Draw settings panel background
         settings_bg = pygame.Rect(sidebar_x - 20, 140, button_width + 40, 70)
         pygame.draw.rect(screen, (220, 230, 240), settings_bg, border_radius=8)
         pygame.draw.rect(screen, (100, 120, 140), settings_bg, width=2, border_radius=8)
 
-        # Draw dropdowns with compact labels
-        row_dropdown.draw(screen, "R:", scroll_y)  # Shorter label
-        col_dropdown.draw(screen, "C:", scroll_y)  # Shorter label
-
         # Draw algorithm buttons with enhanced style
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-
         button_colors = {
             "Depth-First Search": (220, 70, 70),  # Red
             "Breadth-First Search": (70, 100, 230),  # Blue
@@ -442,7 +595,7 @@ def main():
                 )
 
             # Button text
-            text_surf = BUTTON_FONT.render(text, True, theme["button_text"])
+            text_surf = render_text(BUTTON_FONT, text, True, theme["button_text"])
             screen.blit(
                 text_surf,
                 (
@@ -468,6 +621,10 @@ def main():
             is_hovered = adjusted_rect.collidepoint(mouse_x, mouse_y)
             draw_button(screen, adjusted_rect, text, BUTTON_FONT, is_hovered)
 
+        # Draw dropdowns with compact labels, after the buttons they open over
+        row_dropdown.draw(screen, "R:", scroll_y)  # Shorter label
+        col_dropdown.draw(screen, "C:", scroll_y)  # Shorter label
+
         # Draw search speed display with improved style
         speed_bg = pygame.Rect(
             sidebar_x - 20, by + button_height + 5 - scroll_y, button_width + 40, 40
@@ -476,7 +633,7 @@ def main():
         pygame.draw.rect(screen, (100, 120, 140), speed_bg, width=1, border_radius=8)
 
         speed_text = f"Search Speed: {game.search_speed}"
-        speed_surf = TEXT_FONT.render(speed_text, True, BLACK)
+        speed_surf = render_text(TEXT_FONT, speed_text, True, BLACK)
         screen.blit(speed_surf, (sidebar_x, by + button_height + 15 - scroll_y))
 
         # Draw scrollbar if needed
@@ -494,11 +651,16 @@ def main():
         pygame.draw.rect(screen, theme["header_accent"], (0, footer_y, WINDOW_WIDTH, 3))
 
         # Draw instructions in footer
-        instr1 = TEXT_FONT.render(
-            "Use W/A/S/D or Arrow keys to move manually!", True, theme["footer_text"]
+        instr1 = render_text(
+            TEXT_FONT,
+            "Use W/A/S/D or Arrow keys to move manually!",
+            True,
+            theme["footer_text"],
         )
-        instr2 = TEXT_FONT.render(
-            "Or click algorithm buttons to visualize search!",
+        instr2 = render_text(
+            TEXT_FONT,
+            "Or click algorithm buttons to visualize search! "
+            "Scroll over the maze to zoom, drag to pan.",
             True,
             theme["footer_text"],
         )
@@ -507,8 +669,8 @@ def main():
 
         # Add copyright notice
         copyright_text = "© Dinesh Pandikona. All rights reserved 2025"
-        copyright_surf = pygame.font.SysFont("Arial", 16).render(
-            copyright_text, True, (200, 200, 200)
+        copyright_surf = render_text(
+            get_font("Arial", 16), copyright_text, True, (200, 200, 200)
         )
         screen.blit(
             copyright_surf,
@@ -531,7 +693,7 @@ def main():
                 "A* Search - 2: cost = (Manhattan distance to exit) only.",
             ]
             for i, line in enumerate(note_lines):
-                note_surf = SMALL_FONT.render(line, True, BLACK)
+                note_surf = render_text(SMALL_FONT, line, True, BLACK)
                 screen.blit(note_surf, (margin_left + 10, note_y + i * 25))
 
         pygame.display.flip()
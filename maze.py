@@ -1,350 +1,626 @@
 # maze.py
+import heapq
 import random
+from array import array
 from collections import deque
+import numpy as np
+from heuristics import heuristic_tables
 from stats import AlgorithmStats, calculate_path_length
 
 
-class MazeCell:
-    def __init__(self):
-        self.left = {"neighborIndex": -1, "connection": False}
-        self.right = {"neighborIndex": -1, "connection": False}
-        self.top = {"neighborIndex": -1, "connection": False}
-        self.bottom = {"neighborIndex": -1, "connection": False}
+# Connection bits stored per cell in MazeGrid.cells.
+# A set bit means there is a passage (no wall) on that side of the cell.
+LEFT = 1
+RIGHT = 2
+TOP = 4
+BOTTOM = 8
+
+# Neighbor visiting orders used by the searches
+DEFAULT_ORDER = (LEFT, RIGHT, TOP, BOTTOM)
+DFS_ORDER = (RIGHT, BOTTOM, LEFT, TOP)
+
+
+class MazeGrid:
+    """Compact maze storing a 4-bit connection mask per cell in a bytearray"""
+
+    def __init__(self, rows, cols, cells=None):
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        # One byte per cell, all walls closed unless existing masks are given
+        self.cells = bytearray(self.size) if cells is None else cells
+        self.goal = self.size - 1  # Searches start at cell 0 and end here
+        self.offsets = {LEFT: -1, RIGHT: 1, TOP: -cols, BOTTOM: cols}
+        self._step_tables = {}
+
+    def __len__(self):
+        return self.size
+
+    def neighbor_index(self, idx, direction):
+        """Index of the adjacent cell in a direction, or -1 outside the maze"""
+        row, col = divmod(idx, self.cols)
+        if direction == LEFT:
+            return idx - 1 if col > 0 else -1
+        if direction == RIGHT:
+            return idx + 1 if col < self.cols - 1 else -1
+        if direction == TOP:
+            return idx - self.cols if row > 0 else -1
+        if direction == BOTTOM:
+            return idx + self.cols if row < self.rows - 1 else -1
+        return -1
+
+    def adjacent(self, idx):
+        """Indices of all cells sharing a side with idx, whether walled or not"""
+        row, col = divmod(idx, self.cols)
+        cells = []
+        if col > 0:
+            cells.append(idx - 1)
+        if col < self.cols - 1:
+            cells.append(idx + 1)
+        if row > 0:
+            cells.append(idx - self.cols)
+        if row < self.rows - 1:
+            cells.append(idx + self.cols)
+        return cells
+
+    def is_open(self, idx, direction):
+        return bool(self.cells[idx] & direction)
+
+    def masks(self):
+        """Connection masks of all cells as a uint8 array of shape (rows, cols)"""
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.rows, self.cols)
+
+    def connect(self, cell1, cell2):
+        """Remove the wall between two adjacent cells"""
+        if cell1 > cell2:
+            cell1, cell2 = cell2, cell1
+        # Check the vertical step first: in a single-column maze it is also 1
+        if cell2 - cell1 == self.cols:
+            self.cells[cell1] |= BOTTOM
+            self.cells[cell2] |= TOP
+        elif cell2 - cell1 == 1:
+            self.cells[cell1] |= RIGHT
+            self.cells[cell2] |= LEFT
+
+    def neighbors(self, idx, order=DEFAULT_ORDER):
+        """Indices of the cells reachable from idx, visited in the given order"""
+        table = self._step_tables.get(order)
+        if table is None:
+            # For each of the 16 masks, the offsets of its open sides in order
+            table = [
+                tuple(self.offsets[d] for d in order if mask & d) for mask in range(16)
+            ]
+            self._step_tables[order] = table
+        return [idx + step for step in table[self.cells[idx]]]
+
+
+def make_rng(seed=None):
+    """A random.Random for a seed. An existing Random instance is passed through."""
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(seed)
+
+
+def make_numpy_rng(seed=None):
+    """A numpy Generator for a seed, Random instance or existing Generator"""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    if isinstance(seed, random.Random):
+        return np.random.default_rng(seed.getrandbits(64))
+    return np.random.default_rng(seed)
+
+
+def new_seed():
+    """A fresh 32-bit seed for a maze that can be reproduced later"""
+    return random.SystemRandom().getrandbits(32)
 
 
 def generate_cells(rows, cols):
-    maze_size = rows * cols
-    cell_map = [MazeCell() for _ in range(maze_size)]
-    for i in range(maze_size):
-        if i % cols != 0:
-            cell_map[i].left = {"neighborIndex": i - 1, "connection": False}
-        if (i + 1) % cols != 0:
-            cell_map[i].right = {"neighborIndex": i + 1, "connection": False}
-        if i - cols >= 0:
-            cell_map[i].top = {"neighborIndex": i - cols, "connection": False}
-        if i + cols < maze_size:
-            cell_map[i].bottom = {"neighborIndex": i + cols, "connection": False}
-    return cell_map
-
-
-def find_all_paths(cell_map, rows, cols):
-    paths = []
-    maze_size = rows * cols
-    for i in range(maze_size):
-        right_idx = cell_map[i].right["neighborIndex"]
-        if right_idx != -1:
-            paths.append(
-                {"cell1": i, "cell2": right_idx, "weight": random.randint(0, 99)}
-            )
-        bottom_idx = cell_map[i].bottom["neighborIndex"]
-        if bottom_idx != -1:
-            paths.append(
-                {"cell1": i, "cell2": bottom_idx, "weight": random.randint(0, 99)}
-            )
-    return sorted(paths, key=lambda x: x["weight"])
-
-
-def build_path(cell_map, cell1, cell2, cols):
-    if cell2 - cell1 == 1:
-        cell_map[cell1].right["connection"] = True
-        cell_map[cell2].left["connection"] = True
-    elif cell2 - cell1 == cols:
-        cell_map[cell1].bottom["connection"] = True
-        cell_map[cell2].top["connection"] = True
-
-
-def select_paths(cell_map, rows, cols):
-    paths = find_all_paths(cell_map, rows, cols)
-    reps = list(range(rows * cols))
-
-    def find_rep(x):
-        return reps[x]
-
-    def set_rep(old, new):
-        for i in range(len(reps)):
-            if reps[i] == old:
-                reps[i] = new
-
-    while True:
-        if all(reps[i] == reps[0] for i in range(len(reps))):
-            break
-        if not paths:
-            break
-        path = paths.pop(0)
-        if find_rep(path["cell1"]) != find_rep(path["cell2"]):
-            build_path(cell_map, path["cell1"], path["cell2"], cols)
-            old_rep = find_rep(path["cell1"])
-            new_rep = find_rep(path["cell2"])
-            set_rep(old_rep, new_rep)
-
-
-def backtrack(search_map, paths_searched, index):
-    if index != 0:
-        for path in reversed(paths_searched):
-            if path["to"] == index:
-                search_map[path["from"]]["inSolution"] = True
-                backtrack(search_map, paths_searched, path["from"])
+    return MazeGrid(rows, cols)
+
+
+def find_all_paths(rows, cols, rng=None):
+    """All walls between adjacent cells as two int32 index arrays, shuffled"""
+    index = np.arange(rows * cols, dtype=np.int32).reshape(rows, cols)
+    right = index[:, :-1].ravel()
+    bottom = index[:-1, :].ravel()
+    cell1 = np.concatenate((right, bottom))
+    cell2 = np.concatenate((right + 1, bottom + cols))
+    # A single random permutation replaces per-edge weights and a sort
+    order = make_numpy_rng(rng).permutation(len(cell1))
+    return cell1[order], cell2[order]
+
+
+def build_paths(cell_map, cell1, cell2):
+    """Open the passages between each pair of cells in the two index arrays"""
+    cells = np.frombuffer(cell_map.cells, dtype=np.uint8)
+    # Test the vertical step: in a single-column maze it is also 1
+    down = cell2 - cell1 == cell_map.cols
+    across = ~down
+    # Every cell has at most one right and one bottom neighbor, so the
+    # indices below are unique and plain fancy-index assignment is safe
+    cells[cell1[across]] |= RIGHT
+    cells[cell2[across]] |= LEFT
+    cells[cell1[down]] |= BOTTOM
+    cells[cell2[down]] |= TOP
+
+
+class DisjointSet:
+    """Union-find over cell indices with path compression and union by rank"""
+
+    def __init__(self, size):
+        self.parent = array("i", range(size))
+        self.rank = bytearray(size)  # Rank never exceeds log2(size)
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # Point every node on the walked path straight at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        """Merge the sets containing a and b. Returns False if already merged."""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        rank = self.rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        return True
+
+
+def select_paths(cell_map, rows, cols, rng=None):
+    cell1, cell2 = find_all_paths(rows, cols, rng)
+    sets = DisjointSet(rows * cols)
+    remaining = rows * cols - 1  # A spanning tree over n cells has n - 1 edges
+    selected = array("i")
+    union = sets.union
+
+    # memoryview iteration yields plain ints straight from the contiguous arrays
+    for cursor, (a, b) in enumerate(zip(memoryview(cell1), memoryview(cell2))):
+        if union(a, b):
+            selected.append(cursor)
+            remaining -= 1
+            if remaining == 0:
                 break
 
+    selected = np.frombuffer(selected, dtype=np.int32)
+    build_paths(cell_map, cell1[selected], cell2[selected])
+
+
+# Bits of a cell's byte in a search_map
+SEARCHED = 1
+IN_SOLUTION = 2
+
+NO_PARENT = -1  # Parent entry of a cell no search has reached yet
+
+
+def new_search_map(size):
+    """Search state of every cell, one byte each, all unsearched"""
+    return bytearray(size)
+
+
+def clear_search_map(search_map):
+    """Reset every cell of a search_map in place"""
+    np.frombuffer(search_map, dtype=np.uint8).fill(0)
+
+
+def clear_solution(search_map):
+    """Drop the solution marks of a search_map, keeping the searched ones"""
+    state = np.frombuffer(search_map, dtype=np.uint8)
+    state &= SEARCHED
+
+
+def new_parents(size):
+    """Parent array for a search: the cell each cell was discovered from"""
+    return array("i", [NO_PARENT]) * size
+
+
+def clear_parents(parents):
+    """Reset a parent array in place so it can be reused for another search"""
+    np.frombuffer(parents, dtype=np.int32).fill(NO_PARENT)
+
+
+def solution_path(parents, index):
+    """Cells from the start to index, following the parent array back"""
+    path = [index]
+    while index != 0:
+        index = parents[index]
+        if index == NO_PARENT:
+            return []  # index was never reached
+        path.append(index)
+    path.reverse()
+    return path
+
+
+def backtrack(search_map, parents, index, observer=None):
+    """Mark the cells leading from the start to index as part of the solution"""
+    while index != 0:
+        index = parents[index]
+        if index == NO_PARENT:
+            break
+        search_map[index] |= IN_SOLUTION
+        if observer is not None:
+            observer.mark(index, search_map[index])
+
+
+class SearchObserver:
+    """Receives every cell state change a solver makes.
+
+    Solvers call mark(cell, state) with the cell's new search_map byte. This
+    base class ignores them; pass None instead to skip the calls entirely.
+    """
+
+    def mark(self, cell, state):
+        pass
+
+
+class SearchCancelled(Exception):
+    """Raised inside a solver whose SearchRecorder was cancelled"""
+
+
+class SearchRecorder(SearchObserver):
+    """Records a search's state changes so they can be played back for display.
 
-def depth_first_search(cell_map, search_map, paths_searched, collect_stats=False):
-    """Depth-First Search implementation that returns stats when collect_stats=True"""
-    if collect_stats:
-        stats = AlgorithmStats("Depth-First Search")
-        stats.start_timer()
+    step() hands the changes out in batches, in the order they were made.
+    The solver may still be running on another thread while they are played
+    back: step() only hands out changes that are fully recorded, and done
+    stays False until the solver calls finish(). cancel() makes the solver's
+    next mark() raise SearchCancelled so an abandoned search stops early.
+    """
 
-    stack = [{"cell": 0, "neighbors": cell_map[0]}]
-    search_map[0]["searched"] = True
+    def __init__(self):
+        self.cells = array("i")
+        self.states = bytearray()
+        self.position = 0  # Changes before this index were already handed out
+        self.finished = False
+        self.cancelled = False
+        self.stats = None  # AlgorithmStats, once the solver has finished
+        self.error = None  # Exception the solver raised, if any
+
+    def mark(self, cell, state):
+        if self.cancelled:
+            raise SearchCancelled
+        self.cells.append(cell)
+        # Appended last, so len(states) never counts a half-written change
+        self.states.append(state)
+
+    def finish(self, stats=None, error=None):
+        self.stats = stats
+        self.error = error
+        self.finished = True
+
+    def cancel(self):
+        self.cancelled = True
+
+    @property
+    def done(self):
+        # finished is read first, so no more changes can follow the length
+        return self.finished and self.position >= len(self.states)
+
+    def step(self, max_events):
+        """The next batch of at most max_events changes as (cells, states)"""
+        start = self.position
+        self.position = min(start + max_events, len(self.states))
+        return self.cells[start : self.position], self.states[start : self.position]
+
+
+def apply_changes(search_map, cells, states):
+    """Apply a batch of (cell, state) changes from a SearchRecorder.
+
+    Solvers only ever add state bits, so the states can be OR-ed in. That
+    keeps the result right when a cell appears more than once in a batch.
+    """
+    np.bitwise_or.at(
+        np.frombuffer(search_map, dtype=np.uint8),
+        np.frombuffer(cells, dtype=np.int32),
+        np.frombuffer(states, dtype=np.uint8),
+    )
+
+
+def _start(name, search_map, observer):
+    """Stats for a new run, with the start cell marked as searched"""
+    stats = AlgorithmStats(name)
+    stats.start_timer()
+    search_map[0] |= SEARCHED
+    if observer is not None:
+        observer.mark(0, search_map[0])
+    return stats
+
+
+def _finish(stats, cells_explored, max_frontier_size, path_length=0):
+    stats.cells_explored = cells_explored
+    stats.max_frontier_size = max_frontier_size
+    stats.path_length = path_length  # 0 when no path was found
+    stats.stop_timer()
+    return stats
+
+
+def _mark_solution(search_map, parents, goal, observer):
+    """Mark the goal and the path back to the start, returning its length"""
+    search_map[goal] |= IN_SOLUTION
+    if observer is not None:
+        observer.mark(goal, search_map[goal])
+    backtrack(search_map, parents, goal, observer)
+    return calculate_path_length(parents, goal)
+
+
+def depth_first_search(cell_map, search_map, parents, observer=None):
+    """Depth-First Search. Returns its AlgorithmStats."""
+    stats = _start("Depth-First Search", search_map, observer)
+    mark = observer.mark if observer is not None else None
+    neighbors = cell_map.neighbors
+    goal = cell_map.goal
+
+    stack = [0]
     cells_explored = 0
     max_frontier_size = 0
 
     while stack:
         max_frontier_size = max(max_frontier_size, len(stack))
-        current = stack.pop()
-        cell_idx = current["cell"]
+        cell_idx = stack.pop()
         cells_explored += 1
 
-        if cell_idx == len(cell_map) - 1:
-            search_map[cell_idx]["inSolution"] = True
-            backtrack(search_map, paths_searched, cell_idx)
-
-            if collect_stats:
-                stats.cells_explored = cells_explored
-                stats.max_frontier_size = max_frontier_size
-                stats.path_length = calculate_path_length(paths_searched)
-                stats.stop_timer()
-                return stats
-
-            return True
-
-        neighbors = current["neighbors"]
-        for direction in ["right", "bottom", "left", "top"]:
-            n_idx = getattr(neighbors, direction)["neighborIndex"]
-            if (
-                n_idx != -1
-                and getattr(neighbors, direction)["connection"]
-                and not search_map[n_idx]["searched"]
-            ):
-                stack.append({"cell": n_idx, "neighbors": cell_map[n_idx]})
-                paths_searched.append({"from": cell_idx, "to": n_idx})
-                search_map[n_idx]["searched"] = True
-                if not collect_stats:
-                    yield
-
-    if collect_stats:
-        stats.cells_explored = cells_explored
-        stats.max_frontier_size = max_frontier_size
-        stats.path_length = 0  # No path found
-        stats.stop_timer()
-        return stats
-
-    return False
-
-
-def breadth_first_search(cell_map, search_map, paths_searched, collect_stats=False):
-    """Breadth-First Search implementation that returns stats when collect_stats=True"""
-    if collect_stats:
-        stats = AlgorithmStats("Breadth-First Search")
-        stats.start_timer()
-
-    queue = deque([{"cell": 0, "neighbors": cell_map[0]}])
-    search_map[0]["searched"] = True
+        if cell_idx == goal:
+            path_length = _mark_solution(search_map, parents, cell_idx, observer)
+            return _finish(stats, cells_explored, max_frontier_size, path_length)
+
+        for n_idx in neighbors(cell_idx, DFS_ORDER):
+            if not search_map[n_idx] & SEARCHED:
+                stack.append(n_idx)
+                parents[n_idx] = cell_idx
+                search_map[n_idx] |= SEARCHED
+                if mark:
+                    mark(n_idx, search_map[n_idx])
+
+    return _finish(stats, cells_explored, max_frontier_size)
+
+
+def breadth_first_search(cell_map, search_map, parents, observer=None):
+    """Breadth-First Search. Returns its AlgorithmStats."""
+    stats = _start("Breadth-First Search", search_map, observer)
+    mark = observer.mark if observer is not None else None
+    neighbors = cell_map.neighbors
+    goal = cell_map.goal
+
+    queue = deque([0])
     cells_explored = 0
     max_frontier_size = 0
 
     while queue:
         max_frontier_size = max(max_frontier_size, len(queue))
-        current = queue.popleft()
-        cell_idx = current["cell"]
+        cell_idx = queue.popleft()
         cells_explored += 1
 
-        if cell_idx == len(cell_map) - 1:
-            search_map[cell_idx]["inSolution"] = True
-            backtrack(search_map, paths_searched, cell_idx)
-
-            if collect_stats:
-                stats.cells_explored = cells_explored
-                stats.max_frontier_size = max_frontier_size
-                stats.path_length = calculate_path_length(paths_searched)
-                stats.stop_timer()
-                return stats
-
-            return True
-
-        neighbors = current["neighbors"]
-        for direction in ["left", "right", "top", "bottom"]:
-            n_idx = getattr(neighbors, direction)["neighborIndex"]
-            if (
-                n_idx != -1
-                and getattr(neighbors, direction)["connection"]
-                and not search_map[n_idx]["searched"]
-            ):
-                queue.append({"cell": n_idx, "neighbors": cell_map[n_idx]})
-                paths_searched.append({"from": cell_idx, "to": n_idx})
-                search_map[n_idx]["searched"] = True
-                if not collect_stats:
-                    yield
-
-    if collect_stats:
-        stats.cells_explored = cells_explored
-        stats.max_frontier_size = max_frontier_size
-        stats.path_length = 0  # No path found
-        stats.stop_timer()
-        return stats
-
-    return False
+        if cell_idx == goal:
+            path_length = _mark_solution(search_map, parents, cell_idx, observer)
+            return _finish(stats, cells_explored, max_frontier_size, path_length)
+
+        for n_idx in neighbors(cell_idx):
+            if not search_map[n_idx] & SEARCHED:
+                queue.append(n_idx)
+                parents[n_idx] = cell_idx
+                search_map[n_idx] |= SEARCHED
+                if mark:
+                    mark(n_idx, search_map[n_idx])
+
+    return _finish(stats, cells_explored, max_frontier_size)
+
+
+CLOSED = -2  # Cost entry of a cell A* has finished expanding
+
+
+def new_costs(cell_map):
+    """Per-cell cost array reading -1 until set.
+
+    An int array for grids, a SparseArray for mazes without a cells buffer
+    of their own such as InfiniteMaze, where a full array would not fit.
+    """
+    if isinstance(cell_map, MazeGrid):
+        return array("i", [-1]) * len(cell_map)
+    return SparseArray()
 
 
 def a_star_search(
-    cell_map, search_map, paths_searched, rows, cols, choice, collect_stats=False
+    cell_map,
+    search_map,
+    parents,
+    rows,
+    cols,
+    choice,
+    observer=None,
+    prefer_larger_g=True,
 ):
-    """A* Search implementation that returns stats when collect_stats=True"""
-    if collect_stats:
-        stats = AlgorithmStats(f"A* Search ({'f = g + h' if choice == 1 else 'f = h'})")
-        stats.start_timer()
-
-    manhattan_map = []
-    for r in range(rows):
-        for c in range(cols):
-            cost_to_exit = (rows - 1 - r) + (cols - 1 - c)
-            manhattan_map.append({"costToArrive": -1, "costToExit": cost_to_exit})
-    manhattan_map[0]["costToArrive"] = 0
-    search_map[0]["searched"] = True
-    open_list = [{"cell": 0, "neighbors": cell_map[0]}]
+    """A* Search. Returns its AlgorithmStats.
+
+    choice 1 orders the open list by f = g + h, choice 2 by f = h alone.
+    Ties on f go to the larger g when prefer_larger_g is set (for f = g + h
+    that is the cell closer to the exit), then to the earlier insertion.
+    """
+    stats = _start(
+        f"A* Search ({'f = g + h' if choice == 1 else 'f = h'})", search_map, observer
+    )
+    mark = observer.mark if observer is not None else None
+
+    # Shared distance table, computed on access for mazes too large to cache
+    cost_to_exit = heuristic_tables(rows, cols, cell_map.goal).manhattan
+
+    # Best known g of every cell: -1 until reached, CLOSED once expanded.
+    # CLOSED is below every real cost, so a closed cell is never improved and
+    # its open entries all read as stale.
+    cost_to_arrive = new_costs(cell_map)
+    cost_to_arrive[0] = 0
+
+    # The open list is a binary heap of plain ints, so no tuple is built per
+    # push. Each packs, from most to least significant: f, g (inverted when
+    # larger g wins ties), insertion number, cell. Every cell is expanded at
+    # most once and pushes at most 4 neighbors, which bounds the insertion
+    # number by 4 * cells.
+    cell_bits = len(cell_map).bit_length()
+    cell_mask = (1 << cell_bits) - 1
+    g_mask = cell_mask
+    g_flip = g_mask if prefer_larger_g else 0
+    g_shift = cell_bits * 2 + 2
+    f_shift = g_shift + cell_bits
+    counter_step = 1 << cell_bits  # Insertion numbers sit above the cell
+    counter = counter_step
+    open_heap = [cost_to_exit[0] << f_shift | g_flip << g_shift]
+    push = heapq.heappush
+    pop = heapq.heappop
+    neighbors = cell_map.neighbors
+    goal = cell_map.goal
     cells_explored = 0
     max_frontier_size = 0
 
-    while open_list:
-        max_frontier_size = max(max_frontier_size, len(open_list))
-
-        smallest_cost = float("inf")
-        smallest_i = 0
-        for i, item in enumerate(open_list):
-            idx = item["cell"]
-            if choice == 1:
-                cost = (
-                    manhattan_map[idx]["costToArrive"]
-                    + manhattan_map[idx]["costToExit"]
-                )
-            else:
-                cost = manhattan_map[idx]["costToExit"]
-            if cost < smallest_cost:
-                smallest_cost = cost
-                smallest_i = i
-
-        current = open_list.pop(smallest_i)
-        cell_idx = current["cell"]
+    while open_heap:
+        if len(open_heap) > max_frontier_size:
+            max_frontier_size = len(open_heap)
+        entry = pop(open_heap)
+        cell_idx = entry & cell_mask
+        g = (entry >> g_shift & g_mask) ^ g_flip
+        if g != cost_to_arrive[cell_idx]:
+            continue  # Stale entry, or the cell is already closed
+        cost_to_arrive[cell_idx] = CLOSED
         cells_explored += 1
 
-        if cell_idx == len(cell_map) - 1:
-            search_map[cell_idx]["inSolution"] = True
-            backtrack(search_map, paths_searched, cell_idx)
-
-            if collect_stats:
-                stats.cells_explored = cells_explored
-                stats.max_frontier_size = max_frontier_size
-                stats.path_length = calculate_path_length(paths_searched)
-                stats.stop_timer()
-                return stats
-
-            return True
-
-        neighbors = current["neighbors"]
-        for direction in ["left", "right", "top", "bottom"]:
-            n_idx = getattr(neighbors, direction)["neighborIndex"]
-            if n_idx != -1 and getattr(neighbors, direction)["connection"]:
-                current_cost = manhattan_map[cell_idx]["costToArrive"]
-                neighbor_cost = manhattan_map[n_idx]["costToArrive"]
-                if neighbor_cost == -1 or neighbor_cost > current_cost + 1:
-                    manhattan_map[n_idx]["costToArrive"] = current_cost + 1
-                    if not search_map[n_idx]["searched"]:
-                        open_list.append({"cell": n_idx, "neighbors": cell_map[n_idx]})
-                        paths_searched.append({"from": cell_idx, "to": n_idx})
-                        search_map[n_idx]["searched"] = True
-                        if not collect_stats:
-                            yield
-
-    if collect_stats:
-        stats.cells_explored = cells_explored
-        stats.max_frontier_size = max_frontier_size
-        stats.path_length = 0  # No path found
-        stats.stop_timer()
-        return stats
-
-    return False
-
-
-def uniform_cost_search(cell_map, search_map, paths_searched, collect_stats=False):
-    """Uniform Cost Search implementation that returns stats when collect_stats=True"""
-    import heapq
-
-    if collect_stats:
-        stats = AlgorithmStats("Uniform-Cost Search")
-        stats.start_timer()
-
-    pq = [(0, 0, {"cell": 0, "neighbors": cell_map[0]})]
-    search_map[0]["searched"] = True
-    cost_so_far = {0: 0}
+        if cell_idx == goal:
+            path_length = _mark_solution(search_map, parents, cell_idx, observer)
+            return _finish(stats, cells_explored, max_frontier_size, path_length)
+
+        new_cost = g + 1
+        g_key = (new_cost ^ g_flip) << g_shift
+        f_base = new_cost if choice == 1 else 0  # f = f_base + h
+        for n_idx in neighbors(cell_idx):
+            neighbor_cost = cost_to_arrive[n_idx]
+            if neighbor_cost == -1 or neighbor_cost > new_cost:
+                cost_to_arrive[n_idx] = new_cost
+                parents[n_idx] = cell_idx
+                f = f_base + cost_to_exit[n_idx]
+                push(open_heap, f << f_shift | g_key | counter | n_idx)
+                counter += counter_step
+                if not search_map[n_idx] & SEARCHED:
+                    search_map[n_idx] |= SEARCHED
+                    if mark:
+                        mark(n_idx, search_map[n_idx])
+
+    return _finish(stats, cells_explored, max_frontier_size)
+
+
+STEP_COST = 1  # Cost of moving between two connected cells
+
+
+class SparseArray(dict):
+    """Stand-in for an int array that only stores entries that were set.
+
+    Missing entries read as -1, like a fresh cost or parent array.
+    """
+
+    def __missing__(self, idx):
+        return -1
+
+
+def uniform_cost_search(
+    cell_map, search_map, parents, observer=None, frontier="bucket"
+):
+    """Uniform Cost Search. Returns its AlgorithmStats.
+
+    frontier "bucket" is Dial's bucket queue. Every step costs STEP_COST, so
+    each pushed cell costs exactly one step more than the cell being expanded
+    and two FIFO buckets, for the current cost and the next, hold the whole
+    frontier. "heap" uses a binary heap of (cost, cell) instead. Costs are
+    kept by new_costs, so both also run on unbounded mazes.
+    """
+    name = "Uniform-Cost Search" + (" (heap)" if frontier == "heap" else "")
+    stats = _start(name, search_map, observer)
+    mark = observer.mark if observer is not None else None
+    neighbors = cell_map.neighbors
+    goal = cell_map.goal
+
+    cost_so_far = new_costs(cell_map)
+    cost_so_far[0] = 0
     cells_explored = 0
     max_frontier_size = 0
 
-    while pq:
-        max_frontier_size = max(max_frontier_size, len(pq))
-        current_cost, _, current = heapq.heappop(pq)
-        cell_idx = current["cell"]
+    if frontier == "heap":
+        heap = [(0, 0)]
+        push = heapq.heappush
+        pop = heapq.heappop
+        while heap:
+            max_frontier_size = max(max_frontier_size, len(heap))
+            current_cost, cell_idx = pop(heap)
+            if current_cost > cost_so_far[cell_idx]:
+                continue  # Reached more cheaply since this entry was pushed
+            cells_explored += 1
+
+            if cell_idx == goal:
+                path_length = _mark_solution(search_map, parents, cell_idx, observer)
+                return _finish(stats, cells_explored, max_frontier_size, path_length)
+
+            new_cost = current_cost + STEP_COST
+            for n_idx in neighbors(cell_idx):
+                known_cost = cost_so_far[n_idx]
+                if known_cost == -1 or new_cost < known_cost:
+                    cost_so_far[n_idx] = new_cost
+                    push(heap, (new_cost, n_idx))
+                    if not search_map[n_idx] & SEARCHED:
+                        parents[n_idx] = cell_idx
+                        search_map[n_idx] |= SEARCHED
+                        if mark:
+                            mark(n_idx, search_map[n_idx])
+        return _finish(stats, cells_explored, max_frontier_size)
+
+    # The buckets are inlined rather than wrapped in a class, since method
+    # calls per push and pop cost as much as the search itself
+    current = deque([0])  # Cells at current_cost
+    following = deque()  # Cells at current_cost + STEP_COST
+    current_cost = 0
+    queued = 1
+    while queued:
+        max_frontier_size = max(max_frontier_size, queued)
+        if not current:
+            current, following = following, current
+            current_cost += STEP_COST
+        cell_idx = current.popleft()
+        queued -= 1
+        if current_cost > cost_so_far[cell_idx]:
+            continue  # Reached more cheaply since this entry was pushed
         cells_explored += 1
 
-        if cell_idx == len(cell_map) - 1:
-            search_map[cell_idx]["inSolution"] = True
-            backtrack(search_map, paths_searched, cell_idx)
-
-            if collect_stats:
-                stats.cells_explored = cells_explored
-                stats.max_frontier_size = max_frontier_size
-                stats.path_length = calculate_path_length(paths_searched)
-                stats.stop_timer()
-                return stats
-
-            return True
-
-        neighbors = current["neighbors"]
-        for direction in ["left", "right", "top", "bottom"]:
-            n_idx = getattr(neighbors, direction)["neighborIndex"]
-            if n_idx != -1 and getattr(neighbors, direction)["connection"]:
-                new_cost = current_cost + 1
-                if n_idx not in cost_so_far or new_cost < cost_so_far[n_idx]:
-                    cost_so_far[n_idx] = new_cost
-                    heapq.heappush(
-                        pq,
-                        (
-                            new_cost,
-                            n_idx,
-                            {"cell": n_idx, "neighbors": cell_map[n_idx]},
-                        ),
-                    )
-                    if not search_map[n_idx]["searched"]:
-                        paths_searched.append({"from": cell_idx, "to": n_idx})
-                        search_map[n_idx]["searched"] = True
-                        if not collect_stats:
-                            yield
-
-    if collect_stats:
-        stats.cells_explored = cells_explored
-        stats.max_frontier_size = max_frontier_size
-        stats.path_length = 0  # No path found
-        stats.stop_timer()
-        return stats
-
-    return False
+        if cell_idx == goal:
+            path_length = _mark_solution(search_map, parents, cell_idx, observer)
+            return _finish(stats, cells_explored, max_frontier_size, path_length)
+
+        new_cost = current_cost + STEP_COST
+        for n_idx in neighbors(cell_idx):
+            known_cost = cost_so_far[n_idx]
+            if known_cost == -1 or new_cost < known_cost:
+                cost_so_far[n_idx] = new_cost
+                following.append(n_idx)
+                queued += 1
+                if not search_map[n_idx] & SEARCHED:
+                    parents[n_idx] = cell_idx
+                    search_map[n_idx] |= SEARCHED
+                    if mark:
+                        mark(n_idx, search_map[n_idx])
+
+    return _finish(stats, cells_explored, max_frontier_size)
 
 
 def ant_colony_optimization(
-    cell_map, search_map, paths_searched, rows, cols, collect_stats=False
+    cell_map, search_map, parents, rows, cols, observer=None, rng=None
 ):
-    """Ant Colony Optimization implementation that returns stats when collect_stats=True"""
-    if collect_stats:
-        stats = AlgorithmStats("Ant Colony Optimization")
-        stats.start_timer()
+    """Ant Colony Optimization. Returns its AlgorithmStats."""
+    rng = make_rng(rng)
+    stats = _start("Ant Colony Optimization", search_map, observer)
+    mark = observer.mark if observer is not None else None
 
     num_ants = 10
     num_iterations = 5
@@ -352,27 +628,22 @@ def ant_colony_optimization(
     beta = 2.0
     evaporation_rate = 0.5
 
+    # Every edge starts at 0.1 and evaporates at the same rate, so only
+    # edges with deposits are stored, in units of the shared scale factor:
+    # an edge's pheromone is scale * pheromone.get(edge, 0.1). Evaporation
+    # then only shrinks scale, and memory grows with the ants' paths rather
+    # than the size of the maze.
     pheromone = {}
-    for i in range(len(cell_map)):
-        neighbors = cell_map[i]
-        for direction in ["left", "right", "top", "bottom"]:
-            n_idx = getattr(neighbors, direction)["neighborIndex"]
-            if n_idx != -1 and getattr(neighbors, direction)["connection"]:
-                pheromone[(i, n_idx)] = 0.1
+    scale = 1.0
 
     best_path = None
     best_path_length = float("inf")
     cells_explored = 0
     max_frontier_size = 0
 
-    exit_idx = rows * cols - 1
-    exit_row = exit_idx // cols
-    exit_col = exit_idx % cols
-
-    def get_heuristic(idx):
-        row = idx // cols
-        col = idx % cols
-        return abs(row - exit_row) + abs(col - exit_col)
+    exit_idx = cell_map.goal
+    # (1 / (distance to exit + 1)) ** beta for every cell, shared with A*
+    eta_beta = heuristic_tables(rows, cols, exit_idx).eta_power(beta)
 
     for iteration in range(num_iterations):
         all_paths = []
@@ -386,17 +657,11 @@ def ant_colony_optimization(
 
             while current_node != exit_idx:
                 ant_cells_explored += 1
-                neighbors = cell_map[current_node]
-                possible_moves = []
-
-                for direction in ["left", "right", "top", "bottom"]:
-                    n_idx = getattr(neighbors, direction)["neighborIndex"]
-                    if (
-                        n_idx != -1
-                        and getattr(neighbors, direction)["connection"]
-                        and n_idx not in visited
-                    ):
-                        possible_moves.append(n_idx)
+                possible_moves = [
+                    n_idx
+                    for n_idx in cell_map.neighbors(current_node)
+                    if n_idx not in visited
+                ]
 
                 if not possible_moves:
                     if len(path) > 1:
@@ -408,9 +673,8 @@ def ant_colony_optimization(
 
                 probabilities = []
                 for next_node in possible_moves:
-                    tau = pheromone.get((current_node, next_node), 0.1)
-                    eta = 1.0 / (get_heuristic(next_node) + 1)
-                    prob = (tau**alpha) * (eta**beta)
+                    tau = scale * pheromone.get((current_node, next_node), 0.1)
+                    prob = (tau**alpha) * eta_beta[next_node]
                     probabilities.append(prob)
 
                 total = sum(probabilities)
@@ -419,7 +683,7 @@ def ant_colony_optimization(
                 else:
                     probabilities = [p / total for p in probabilities]
 
-                r = random.random()
+                r = rng.random()
                 cumulative_prob = 0
                 chosen_idx = 0
 
@@ -434,11 +698,11 @@ def ant_colony_optimization(
                 visited[next_node] = True
                 current_node = next_node
 
-                if not search_map[next_node]["searched"]:
-                    search_map[next_node]["searched"] = True
-                    paths_searched.append({"from": path[-2], "to": next_node})
-                    if not collect_stats:
-                        yield
+                if not search_map[next_node] & SEARCHED:
+                    search_map[next_node] |= SEARCHED
+                    parents[next_node] = path[-2]
+                    if mark:
+                        mark(next_node, search_map[next_node])
 
             cells_explored += ant_cells_explored
             max_frontier_size = max(max_frontier_size, len(visited))
@@ -452,35 +716,20 @@ def ant_colony_optimization(
                     best_path = path
                     best_path_length = path_length
 
-        for edge in pheromone:
-            pheromone[edge] *= 1 - evaporation_rate
+        scale *= 1 - evaporation_rate
 
         for i, path in enumerate(all_paths):
             path_length = all_path_lengths[i]
             deposit = 1.0 / path_length if path_length > 0 else 0
             for j in range(len(path) - 1):
                 edge = (path[j], path[j + 1])
-                pheromone[edge] = pheromone.get(edge, 0) + deposit
+                pheromone[edge] = pheromone.get(edge, 0.1) + deposit / scale
 
     if best_path:
-        for i in range(len(best_path)):
-            node = best_path[i]
-            search_map[node]["inSolution"] = True
-
-        if collect_stats:
-            stats.cells_explored = cells_explored
-            stats.max_frontier_size = max_frontier_size
-            stats.path_length = best_path_length
-            stats.stop_timer()
-            return stats
-
-        return True
-
-    if collect_stats:
-        stats.cells_explored = cells_explored
-        stats.max_frontier_size = max_frontier_size
-        stats.path_length = 0  # No path found
-        stats.stop_timer()
-        return stats
+        for node in best_path:
+            search_map[node] |= IN_SOLUTION
+            if mark:
+                mark(node, search_map[node])
+        return _finish(stats, cells_explored, max_frontier_size, best_path_length)
 
-    return False
+    return _finish(stats, cells_explored, max_frontier_size)
@@ -0,0 +1,159 @@
+# maze_io.py
+import mmap
+import struct
+import sys
+import numpy as np
+from maze import MazeGrid
+
+# File layout: a fixed header followed by the connection masks of every cell in
+# row-major order, packed two cells per byte (even index in the low nibble).
+MAGIC = b"MAZY"
+VERSION = 1
+# magic, version, rows, cols, seed, generator name
+HEADER = struct.Struct("<4sH2xIIQ16s")
+MAX_GENERATOR_NAME = 16  # Bytes in the header's generator name field
+NO_SEED = 2**64 - 1  # Stored when the maze has no known seed
+
+CHUNK_CELLS = 1 << 20  # Cells packed per write when saving a grid
+
+
+def pack_masks(masks):
+    """Pack an even-length run of connection masks two per byte"""
+    masks = np.frombuffer(masks, dtype=np.uint8)
+    return (masks[0::2] | (masks[1::2] << 4)).tobytes()
+
+
+def encode_generator_name(generator):
+    """Header bytes of a generator name, which must fit its field unchanged"""
+    try:
+        name = generator.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError(f"Generator name {generator!r} is not ASCII") from None
+    if len(name) > MAX_GENERATOR_NAME:
+        raise ValueError(
+            f"Generator name {generator!r} is longer than "
+            f"{MAX_GENERATOR_NAME} bytes"
+        )
+    return name
+
+
+def write_maze(path, rows, cols, row_stream, seed=None, generator=""):
+    """Write a maze file from a stream of row masks without holding the maze.
+
+    Works with generators.eller_rows for mazes too large to build in memory.
+    Raises ValueError, before creating the file, for a generator name that
+    is not ASCII or longer than MAX_GENERATOR_NAME bytes.
+    """
+    name = encode_generator_name(generator)
+    with open(path, "wb") as file:
+        file.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                rows,
+                cols,
+                NO_SEED if seed is None else seed,
+                name,
+            )
+        )
+        pending = b""  # Odd trailing cell waiting for its partner nibble
+        for masks in row_stream:
+            data = pending + bytes(masks)
+            even = len(data) & ~1
+            file.write(pack_masks(data[:even]))
+            pending = data[even:]
+        if pending:
+            file.write(pack_masks(pending + b"\0"))
+
+
+def save_maze(path, cell_map, seed=None, generator=""):
+    """Save a grid to a maze file"""
+    cells = cell_map.cells
+    chunks = (
+        cells[start : start + CHUNK_CELLS]
+        for start in range(0, cell_map.size, CHUNK_CELLS)
+    )
+    write_maze(path, cell_map.rows, cell_map.cols, chunks, seed, generator)
+
+
+class PackedCells:
+    """Read-only view of nibble-packed masks that indexes like MazeGrid.cells"""
+
+    def __init__(self, data, size):
+        self.data = data
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, idx):
+        byte = self.data[idx >> 1]
+        return byte >> 4 if idx & 1 else byte & 15
+
+    def unpack(self, start, stop):
+        """Masks for cells start..stop-1 as a uint8 array"""
+        first = start >> 1
+        packed = np.frombuffer(self.data[first : (stop + 1) >> 1], dtype=np.uint8)
+        masks = np.empty(packed.size * 2, dtype=np.uint8)
+        masks[0::2] = packed & 15
+        masks[1::2] = packed >> 4
+        return masks[start - first * 2 : stop - first * 2]
+
+
+class MappedMazeGrid(MazeGrid):
+    """A maze read lazily from a memory-mapped file.
+
+    Opening is O(1); the OS pages rows in as searches or rendering touch them.
+    The grid is read-only.
+    """
+
+    def __init__(self, rows, cols, mapping, seed, generator):
+        cells = PackedCells(memoryview(mapping)[HEADER.size :], rows * cols)
+        super().__init__(rows, cols, cells)
+        self.mapping = mapping
+        self.seed = seed
+        self.generator = generator
+
+    def masks(self):
+        return self.cells.unpack(0, self.size).reshape(self.rows, self.cols)
+
+    def to_grid(self):
+        """Unpack the whole maze into an in-memory MazeGrid"""
+        grid = MazeGrid(self.rows, self.cols)
+        grid.cells[:] = self.cells.unpack(0, self.size).tobytes()
+        return grid
+
+    def close(self):
+        self.cells.data.release()
+        self.mapping.close()
+
+
+def load_maze(path):
+    """Memory-map a maze file, returning a MappedMazeGrid"""
+    with open(path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, rows, cols, seed, generator = HEADER.unpack_from(mapping)
+    if magic != MAGIC or version != VERSION:
+        mapping.close()
+        raise ValueError(f"{path} is not a version {VERSION} maze file")
+    if len(mapping) < HEADER.size + (rows * cols + 1) // 2:
+        mapping.close()
+        raise ValueError(f"{path} is truncated")
+    return MappedMazeGrid(
+        rows,
+        cols,
+        mapping,
+        None if seed == NO_SEED else seed,
+        generator.rstrip(b"\0").decode("ascii"),
+    )
+
+
+if __name__ == "__main__":
+    # Usage: python maze_io.py ROWS COLS OUTPUT_FILE [GENERATOR] [SEED]
+    from generators import generate_maze
+
+    rows, cols, output = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+    generator = sys.argv[4] if len(sys.argv) > 4 else "kruskal"
+    seed = int(sys.argv[5]) if len(sys.argv) > 5 else None
+    save_maze(output, generate_maze(rows, cols, generator, seed), seed, generator)
+    print(f"Saved {rows}x{cols} {generator} maze to {output}")
@@ -0,0 +1,200 @@
+# minimap.py
+import numpy as np
+import pygame
+from config import WHITE, BLACK, LIGHT_CORAL, CORN_FLOWER_BLUE
+from maze import RIGHT, BOTTOM, SEARCHED, IN_SOLUTION
+from ui_components import START_COLOR, END_COLOR
+
+MINIMAP_SIZE = 200  # Longest side of the minimap in pixels
+WALL_SHADE = 0.4  # How much a block with every wall closed is darkened
+VIEW_COLOR = (255, 215, 0)  # Outline of the camera's view
+
+
+def halve(counts):
+    """Sum 2x2 blocks of a count array, padding odd sides with zeros"""
+    rows, cols = counts.shape
+    padded = np.zeros((rows + rows % 2, cols + cols % 2), dtype=np.int32)
+    padded[:rows, :cols] = counts
+    return padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2).sum(
+        axis=(1, 3), dtype=np.int32
+    )
+
+
+def build_levels(counts):
+    """The mipmap levels of a count array, from itself down to one block"""
+    levels = [counts]
+    while max(levels[-1].shape) > 1:
+        levels.append(halve(levels[-1]))
+    return levels
+
+
+class MazePyramid:
+    """Mipmap-style pyramid of cell counts over a maze and its search state.
+
+    Level k holds, for each block of 2**k x 2**k cells, how many cells it
+    covers and how many of their walls are closed, searched and on the
+    solution. Level 0 is read straight from the maze and state bytes.
+    update() adjusts every level for the cells a search just marked, which
+    costs time in the changed cells times the number of levels. image()
+    turns one level into colors and costs time in that level's pixels.
+    """
+
+    def __init__(self, cell_map, search_map):
+        self.cell_map = cell_map
+        self.rows = cell_map.rows
+        self.cols = cell_map.cols
+        masks = cell_map.masks()
+        # Right and bottom walls only, so a wall between two cells counts once
+        walls = ((masks & RIGHT) == 0).astype(np.uint8)
+        walls += (masks & BOTTOM) == 0
+        self.walls = build_levels(walls)
+        self.cells = build_levels(np.ones(masks.shape, dtype=np.uint8))
+        self.refresh(search_map)
+
+    def refresh(self, search_map):
+        """Recount the search state of every cell"""
+        self.search_map = search_map
+        state = np.frombuffer(search_map, dtype=np.uint8).reshape(self.rows, self.cols)
+        self.shown = state.copy()
+        # Level 0 comes from self.shown, so it is not kept twice
+        self.searched = [None] + build_levels(
+            ((state & SEARCHED) != 0).astype(np.int32)
+        )[1:]
+        self.solution = [None] + build_levels(
+            ((state & IN_SOLUTION) != 0).astype(np.int32)
+        )[1:]
+        self.changes = 0
+
+    def update(self, cells):
+        """Recount cells whose search state may have changed"""
+        if not len(cells):
+            return
+        cells = np.unique(np.asarray(cells, dtype=np.int64))
+        new = np.frombuffer(self.search_map, dtype=np.uint8)[cells]
+        shown = self.shown.reshape(-1)
+        old = shown[cells]
+        changed = new != old
+        if not changed.any():
+            return
+        cells, new, old = cells[changed], new[changed], old[changed]
+        shown[cells] = new
+        searched = ((new & SEARCHED) != 0).astype(np.int32) - ((old & SEARCHED) != 0)
+        solution = ((new & IN_SOLUTION) != 0).astype(np.int32)
+        solution -= (old & IN_SOLUTION) != 0
+        rows, cols = np.divmod(cells, self.cols)
+        for level in range(1, len(self.cells)):
+            at = (rows >> level, cols >> level)
+            np.add.at(self.searched[level], at, searched)
+            np.add.at(self.solution[level], at, solution)
+        self.changes += 1
+
+    def level_for(self, width, height):
+        """Finest level with no more blocks than width x height pixels"""
+        for level, cells in enumerate(self.cells):
+            if cells.shape[0] <= height and cells.shape[1] <= width:
+                return level
+        return len(self.cells) - 1
+
+    def image(self, level):
+        """RGB colors of a level, shape (block rows, block cols, 3)"""
+        cells = self.cells[level].astype(np.float32)
+        if level == 0:
+            searched = (self.shown & SEARCHED) != 0
+            solution = (self.shown & IN_SOLUTION) != 0
+        else:
+            searched = self.searched[level]
+            solution = self.solution[level] > 0
+        explored = (searched / cells)[..., None]
+        shade = 1 - WALL_SHADE * self.walls[level] / (2 * cells)
+
+        color = np.array(WHITE, np.float32) * (1 - explored)
+        color += np.array(CORN_FLOWER_BLUE, np.float32) * explored
+        # Any solution cell colors its block, so the path stays visible
+        color[solution] = LIGHT_CORAL
+        color *= shade[..., None]
+        image = color.astype(np.uint8)
+        for idx, marker in ((0, START_COLOR), (self.cell_map.goal, END_COLOR)):
+            row, col = divmod(idx, self.cols)
+            image[row >> level, col >> level] = marker
+        return image
+
+
+class Minimap:
+    """Overview of a maze drawn from a MazePyramid.
+
+    sync() keeps the pyramid on the current maze, rebuilding it for a new
+    maze or recounting it when the search state was changed wholesale, and
+    update() passes along the cells a search step marked. The rendered
+    image is cached until either changes or the minimap is resized. With a
+    camera the view is outlined and clicking the minimap centers it there.
+    """
+
+    def __init__(self, camera=None):
+        self.camera = camera
+        self.pyramid = None
+        self.version = None
+        self.rect = None  # Where the minimap was last drawn
+        self.surface = None
+        self.key = None
+
+    def sync(self, cell_map, search_map, version):
+        if self.pyramid is None or self.pyramid.cell_map is not cell_map:
+            self.pyramid = MazePyramid(cell_map, search_map)
+            self.key = None
+        elif version != self.version or self.pyramid.search_map is not search_map:
+            self.pyramid.refresh(search_map)
+            self.key = None
+        self.version = version
+
+    def update(self, cells):
+        if self.pyramid is not None:
+            self.pyramid.update(cells)
+
+    def size_for(self, max_size=MINIMAP_SIZE):
+        """(width, height) of the minimap with its longest side at max_size"""
+        pyramid = self.pyramid
+        scale = max_size / max(pyramid.rows, pyramid.cols)
+        return (
+            max(1, round(pyramid.cols * scale)),
+            max(1, round(pyramid.rows * scale)),
+        )
+
+    def draw(self, surface, x, y, max_size=MINIMAP_SIZE):
+        """Draw the minimap with its top-left corner at (x, y)"""
+        if self.pyramid is None:
+            return
+        pyramid = self.pyramid
+        width, height = self.size_for(max_size)
+        key = (pyramid.changes, width, height)
+        if key != self.key:
+            self.key = key
+            image = pyramid.image(pyramid.level_for(width, height))
+            # surfarray images are indexed (x, y)
+            self.surface = pygame.surfarray.make_surface(image.transpose(1, 0, 2))
+            if self.surface.get_size() != (width, height):
+                self.surface = pygame.transform.scale(self.surface, (width, height))
+
+        self.rect = pygame.Rect(x, y, width, height)
+        surface.blit(self.surface, self.rect)
+        pygame.draw.rect(surface, BLACK, self.rect.inflate(4, 4), width=2)
+
+        if self.camera is not None and not self.camera.fitted:
+            row0, row1, col0, col1 = self.camera.visible_cells()
+            view = pygame.Rect(
+                x + col0 * width // pyramid.cols,
+                y + row0 * height // pyramid.rows,
+                max(2, (col1 - col0) * width // pyramid.cols),
+                max(2, (row1 - row0) * height // pyramid.rows),
+            )
+            pygame.draw.rect(surface, VIEW_COLOR, view, width=2)
+
+    def handle_click(self, pos):
+        """Center the camera on a clicked spot; True if the click was ours"""
+        if self.camera is None or self.rect is None:
+            return False
+        if not self.rect.collidepoint(pos):
+            return False
+        row = (pos[1] - self.rect.y) * self.pyramid.rows // self.rect.height
+        col = (pos[0] - self.rect.x) * self.pyramid.cols // self.rect.width
+        self.camera.center_on(row, col)
+        return True
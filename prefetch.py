@@ -0,0 +1,118 @@
+# prefetch.py
+import atexit
+import multiprocessing
+import os
+import threading
+import weakref
+from collections import deque
+from generators import generate_maze
+from maze import MazeGrid, new_seed
+
+# Prefetchers with a build that may still be running, stopped at exit so the
+# interpreter doesn't wait for a large maze nobody will use
+_PREFETCHERS = weakref.WeakSet()
+
+
+def _build_maze(connection, rows, cols, generator, seed):
+    """Worker process: build a maze and send back its raw masks"""
+    if hasattr(os, "nice"):
+        os.nice(10)  # Yield the CPU to the UI where cores are scarce
+    cell_map = generate_maze(rows, cols, generator, seed)
+    connection.send_bytes(cell_map.cells)
+    connection.close()
+
+
+class MazePrefetcher:
+    """Builds upcoming mazes in a background process so "New Maze" is instant.
+
+    Keeps a small bounded queue of ready mazes for one (rows, cols, generator)
+    key. Changing the key drops the queued mazes, stops a build of the old
+    size and starts building for the new one. Generation is mostly Python,
+    so it runs in a worker process rather than a thread, where it would hold
+    the GIL and stall the UI. The process sends back the raw connection
+    masks, which take() wraps in a MazeGrid. A thread only waits on it.
+    """
+
+    def __init__(self, depth=2):
+        self.depth = depth
+        self.ready = deque()  # (seed, cells) pairs for self.key
+        self.key = None
+        self.running = True
+        self.process = None  # Worker process of the build in progress
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self._work, daemon=True)
+        self.thread.start()
+        _PREFETCHERS.add(self)
+
+    def request(self, rows, cols, generator):
+        """Set the size that upcoming mazes should be built for"""
+        key = (rows, cols, generator)
+        with self.condition:
+            if key != self.key:
+                self.key = key
+                self.ready.clear()
+                self._stop_build()
+                self.condition.notify()
+
+    def take(self, rows, cols, generator):
+        """Pop a ready (seed, cell_map) pair, or None if none is built yet.
+
+        Also makes this size the one to keep building for.
+        """
+        self.request(rows, cols, generator)
+        with self.condition:
+            if not self.ready:
+                return None
+            seed, cells = self.ready.popleft()
+            self.condition.notify()
+        return seed, MazeGrid(rows, cols, cells)
+
+    def close(self):
+        with self.condition:
+            self.running = False
+            self._stop_build()
+            self.condition.notify()
+
+    def _stop_build(self):
+        # Callers hold self.condition
+        if self.process is not None:
+            self.process.terminate()
+
+    def _work(self):
+        while True:
+            with self.condition:
+                while self.running and (
+                    self.key is None or len(self.ready) >= self.depth
+                ):
+                    self.condition.wait()
+                if not self.running:
+                    return
+                key = self.key
+                rows, cols, generator = key
+                seed = new_seed()
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                self.process = multiprocessing.Process(
+                    target=_build_maze, args=(sender, rows, cols, generator, seed)
+                )
+                self.process.start()
+            sender.close()
+
+            cells = bytearray(rows * cols)
+            try:
+                receiver.recv_bytes_into(cells)
+            except EOFError:
+                cells = None  # Stopped because the key changed, or crashed
+            receiver.close()
+
+            with self.condition:
+                self.process.join()
+                self.process = None
+                # Drop the maze if the requested size changed while building
+                if cells and key == self.key and len(self.ready) < self.depth:
+                    self.ready.append((seed, cells))
+
+
+@atexit.register
+def _close_prefetchers():
+    for prefetcher in list(_PREFETCHERS):
+        prefetcher.close()
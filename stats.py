@@ -27,36 +27,12 @@ class AlgorithmStats:
         )
 
 
-def calculate_path_length(paths_searched):
-    """Calculate the length of the solution path"""
-    # Create a graph of connections
-    graph = {}
-    for path in paths_searched:
-        from_node = path["from"]
-        to_node = path["to"]
-        if from_node not in graph:
-            graph[from_node] = []
-        graph[from_node].append(to_node)
-
-    # Find path from start (0) to end (last node)
-    from collections import deque
-
-    # Find the end node (highest node in paths_searched)
-    end_node = max([path["to"] for path in paths_searched] + [0])
-
-    # Use BFS to find shortest path in the discovered graph
-    queue = deque([(0, [0])])  # (node, path so far)
-    visited = {0}
-
-    while queue:
-        node, path = queue.popleft()
-        if node == end_node:
-            return len(path) - 1  # Number of steps (edges)
-
-        if node in graph:
-            for neighbor in graph[node]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
-
-    return 0  # No path found
+def calculate_path_length(parents, goal):
+    """Number of steps on the discovered path from the start to goal, 0 if none"""
+    steps = 0
+    while goal != 0:
+        goal = parents[goal]
+        if goal == -1:
+            return 0  # goal was never reached
+        steps += 1
+    return steps
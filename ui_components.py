@@ -1,4 +1,6 @@
 # ui_components.py
+from collections import OrderedDict
+import numpy as np
 import pygame
 from config import (
     WHITE,
@@ -9,6 +11,395 @@ from config import (
     HEADER_COLOR,
     BUTTON_HOVER,
 )
+from maze import LEFT, RIGHT, TOP, BOTTOM, SEARCHED, IN_SOLUTION
+
+
+START_COLOR = (50, 205, 50)  # Bright green for start
+END_COLOR = (220, 20, 60)  # Crimson for end
+
+
+def cell_color(idx, state, goal):
+    """Background color of a cell for its search state"""
+    if idx == 0:
+        return START_COLOR
+    if idx == goal:
+        return END_COLOR
+    # Solution path cells (colored in red/light coral)
+    if state & IN_SOLUTION:
+        return LIGHT_CORAL
+    # Searched cells (colored in blue)
+    if state & SEARCHED:
+        return CORN_FLOWER_BLUE
+    return WHITE  # Unexplored
+
+
+# Palette indices of the raster images built by the renderers. Indices 0-3
+# are the search states themselves, so state bytes index it directly.
+RASTER_WALL = 4
+RASTER_START = 5
+RASTER_END = 6
+RASTER_PALETTE = np.array(
+    [
+        WHITE,  # Unexplored
+        CORN_FLOWER_BLUE,  # SEARCHED
+        LIGHT_CORAL,  # IN_SOLUTION
+        LIGHT_CORAL,  # SEARCHED | IN_SOLUTION
+        BLACK,
+        START_COLOR,
+        END_COLOR,
+    ],
+    dtype=np.uint8,
+)
+
+# Below this many pixels per cell the maze is rasterized with NumPy
+RASTER_CELL_SIZE = 4
+
+# Fraction of a repainted area past which the state layer is redrawn whole
+FULL_REPAINT_FRACTION = 0.125
+
+
+def clamp_view(view, rows, cols):
+    """Limit a (row0, row1, col0, col1) view to the cells of the maze.
+
+    A view worked out for a larger maze may reach past this one's edges;
+    None stands for the whole maze.
+    """
+    if view is None:
+        return 0, rows, 0, cols
+    row0, row1, col0, col1 = view
+    row1 = min(max(row1, 0), rows)
+    col1 = min(max(col1, 0), cols)
+    return min(max(row0, 0), row1), row1, min(max(col0, 0), col1), col1
+
+
+class MazeRenderer:
+    """Draws the visible part of a maze from two cached layers.
+
+    The layers cover the cells in view plus half a view of margin on every
+    side, so panning only rebuilds them once the view leaves that area. The
+    wall layer only changes with the maze, cell size or area. The state layer
+    keeps the cell colors between frames and only cells whose search state
+    changed since the last frame are repainted, so a frame costs time in the
+    number of visible cells rather than the size of the maze.
+    """
+
+    def __init__(self):
+        self.cell_map = None
+        self.masks = None
+        self.key = None
+        self.area = None  # (row0, row1, col0, col1) covered by the layers
+        self.walls = None
+        self.states = None
+        self.shown = None  # search states of the area as last painted
+
+    def draw(
+        self,
+        surface,
+        cell_map,
+        search_map,
+        rows,
+        cols,
+        x_off,
+        y_off,
+        cell_size,
+        view=None,
+    ):
+        view = clamp_view(view, rows, cols)
+        if self.cell_map is not cell_map:
+            self.cell_map = cell_map
+            self.masks = cell_map.masks()
+            self.area = None
+        key = (rows, cols, cell_size)
+        area = self.area
+        if (
+            self.key != key
+            or area is None
+            or view[0] < area[0]
+            or view[1] > area[1]
+            or view[2] < area[2]
+            or view[3] > area[3]
+        ):
+            self.key = key
+            self.build(view, rows, cols, cell_size)
+
+        row0, row1, col0, col1 = self.area
+        current = np.frombuffer(search_map, dtype=np.uint8).reshape(rows, cols)
+        current = current[row0:row1, col0:col1]
+        if self.shown is None:
+            changed = None
+        else:
+            changed = np.nonzero(current != self.shown)
+            if len(changed[0]) > current.size * FULL_REPAINT_FRACTION:
+                changed = None
+        if changed is None:
+            self.shown = current.copy()
+            self.paint_all(cols, cell_size)
+        else:
+            self.shown[changed] = current[changed]
+            goal = cell_map.goal
+            fill = self.states.fill
+            for row, col in zip(*(axis.tolist() for axis in changed)):
+                idx = (row + row0) * cols + col + col0
+                fill(
+                    cell_color(idx, search_map[idx], goal),
+                    (col * cell_size, row * cell_size, cell_size, cell_size),
+                )
+
+        # Draw border around the maze
+        border_width = 2
+        maze_rect = pygame.Rect(
+            x_off - border_width,
+            y_off - border_width,
+            cols * cell_size + border_width * 2,
+            rows * cell_size + border_width * 2,
+        )
+        pygame.draw.rect(surface, BLACK, maze_rect, width=border_width)
+        position = (x_off + col0 * cell_size, y_off + row0 * cell_size)
+        surface.blit(self.states, position)
+        surface.blit(self.walls, position)
+
+    def build(self, view, rows, cols, cell_size):
+        """Rebuild both layers for the view plus its margin"""
+        row0, row1, col0, col1 = view
+        margin_rows = (row1 - row0) // 2 + 1
+        margin_cols = (col1 - col0) // 2 + 1
+        self.area = (
+            max(0, row0 - margin_rows),
+            min(rows, row1 + margin_rows),
+            max(0, col0 - margin_cols),
+            min(cols, col1 + margin_cols),
+        )
+        self.walls = render_walls(self.masks, self.cell_map.goal, cell_size, self.area)
+        self.states = pygame.Surface(
+            (
+                (self.area[3] - self.area[2]) * cell_size,
+                (self.area[1] - self.area[0]) * cell_size,
+            )
+        )
+        self.shown = None
+
+    def paint_all(self, cols, cell_size):
+        """Paint every cell of the state layer in one array blit"""
+        row0, _, col0, _ = self.area
+        image = self.shown.copy()
+        for idx, color in ((0, RASTER_START), (self.cell_map.goal, RASTER_END)):
+            row, col = divmod(idx, cols)
+            if 0 <= row - row0 < image.shape[0] and 0 <= col - col0 < image.shape[1]:
+                image[row - row0, col - col0] = color
+        pixels = RASTER_PALETTE[image]
+        pixels = np.repeat(np.repeat(pixels, cell_size, axis=0), cell_size, axis=1)
+        # surfarray images are indexed (x, y)
+        pygame.surfarray.blit_array(self.states, pixels.transpose(1, 0, 2))
+
+
+def render_walls(masks, goal, cell_size, area):
+    """Transparent surface with the walls and start and end markers of an area.
+
+    masks is the (rows, cols) connection mask array of the maze and area the
+    (row0, row1, col0, col1) range of cells to draw. Walls are set straight
+    into the alpha channel with NumPy rather than drawn line by line.
+    """
+    row0, row1, col0, col1 = area
+    block = masks[row0:row1, col0:col1]
+    height = (row1 - row0) * cell_size
+    width = (col1 - col0) * cell_size
+    # Adjust wall thickness based on cell size
+    line_thickness = max(1, int(cell_size / 25))
+    offsets = range(-(line_thickness // 2), line_thickness - line_thickness // 2)
+
+    # One extra pixel so the right and bottom boundary lines are kept.
+    # Walls are wherever there's no connection, which includes the boundary.
+    wall = np.zeros((height + 1, width + 1), dtype=bool)
+    vertical = np.zeros((block.shape[0], block.shape[1] + 1), dtype=bool)
+    vertical[:, :-1] |= (block & LEFT) == 0
+    vertical[:, 1:] |= (block & RIGHT) == 0
+    vertical = np.repeat(vertical, cell_size, axis=0)
+    horizontal = np.zeros((block.shape[0] + 1, block.shape[1]), dtype=bool)
+    horizontal[:-1, :] |= (block & TOP) == 0
+    horizontal[1:, :] |= (block & BOTTOM) == 0
+    horizontal = np.repeat(horizontal, cell_size, axis=1)
+    xs = np.arange(block.shape[1] + 1) * cell_size
+    ys = np.arange(block.shape[0] + 1) * cell_size
+    for offset in offsets:
+        x = np.clip(xs + offset, 0, width)
+        y = np.clip(ys + offset, 0, height)
+        wall[:height, x] |= vertical
+        wall[y, :width] |= horizontal
+
+    layer = pygame.Surface((width + 1, height + 1), pygame.SRCALPHA)
+    layer.fill((0, 0, 0, 0))
+    alpha = pygame.surfarray.pixels_alpha(layer)
+    alpha[:] = wall.T * np.uint8(255)
+    del alpha  # Unlocks the surface
+
+    # Add visual markers for start and end cells
+    cols = masks.shape[1]
+    for idx in (0, goal):
+        row, col = divmod(idx, cols)
+        if not (row0 <= row < row1 and col0 <= col < col1):
+            continue
+        x = (col - col0) * cell_size
+        y = (row - row0) * cell_size
+        if idx == 0:  # Start cell
+            radius = max(3, cell_size // 6)
+            center = (x + cell_size // 2, y + cell_size // 2)
+            pygame.draw.circle(layer, BLACK, center, radius)
+        else:  # End cell
+            margin = max(2, cell_size // 8)
+            pygame.draw.rect(
+                layer,
+                BLACK,
+                (
+                    x + margin,
+                    y + margin,
+                    cell_size - 2 * margin,
+                    cell_size - 2 * margin,
+                ),
+                width=max(1, cell_size // 12),
+            )
+    return layer
+
+
+def raster_image(state, open_right, open_down, ys, xs):
+    """Palette indices of the maze image at image rows ys and columns xs.
+
+    The image of a (rows, cols) block of cells is (2 * rows + 1) x
+    (2 * cols + 1) pixels: a pixel per cell at odd coordinates, and the
+    pixels between two cells showing either a wall or the passage. Passages
+    take the lesser state of the two cells they join, so a solution path
+    stays connected. Only the requested pixels are computed, so sampling a
+    huge block down to the screen costs time in pixels rather than cells.
+    """
+    rows, cols = state.shape
+    if len(ys) == 2 * rows + 1 and len(xs) == 2 * cols + 1:
+        # Every pixel is wanted: plain slices beat the gathers below
+        image = np.full((len(ys), len(xs)), RASTER_WALL, dtype=np.uint8)
+        image[1::2, 1::2] = state
+        image[1::2, 2:-1:2] = np.where(
+            open_right[:, :-1], np.minimum(state[:, :-1], state[:, 1:]), RASTER_WALL
+        )
+        image[2:-1:2, 1::2] = np.where(
+            open_down[:-1, :], np.minimum(state[:-1, :], state[1:, :]), RASTER_WALL
+        )
+        return image
+
+    # Split the wanted pixels into cells (odd) and boundaries (even) per axis
+    odd_y = np.flatnonzero(ys & 1)
+    even_y = np.flatnonzero((ys & 1) == 0)
+    odd_x = np.flatnonzero(xs & 1)
+    even_x = np.flatnonzero((xs & 1) == 0)
+    cell_rows = ys[odd_y] // 2
+    cell_cols = xs[odd_x] // 2
+    # A boundary at 2 * k lies between cells k - 1 and k
+    edge_rows = ys[even_y] // 2
+    edge_cols = xs[even_x] // 2
+    above = np.maximum(edge_rows - 1, 0)
+    below = np.minimum(edge_rows, rows - 1)
+    before = np.maximum(edge_cols - 1, 0)
+    after = np.minimum(edge_cols, cols - 1)
+    inner_rows = ((edge_rows > 0) & (edge_rows < rows))[:, None]
+    inner_cols = ((edge_cols > 0) & (edge_cols < cols))[None, :]
+
+    image = np.full((len(ys), len(xs)), RASTER_WALL, dtype=np.uint8)
+    image[np.ix_(odd_y, odd_x)] = state[np.ix_(cell_rows, cell_cols)]
+    image[np.ix_(odd_y, even_x)] = np.where(
+        open_right[np.ix_(cell_rows, before)] & inner_cols,
+        np.minimum(state[np.ix_(cell_rows, before)], state[np.ix_(cell_rows, after)]),
+        RASTER_WALL,
+    )
+    image[np.ix_(even_y, odd_x)] = np.where(
+        open_down[np.ix_(above, cell_cols)] & inner_rows,
+        np.minimum(state[np.ix_(above, cell_cols)], state[np.ix_(below, cell_cols)]),
+        RASTER_WALL,
+    )
+    return image
+
+
+def sample_positions(size, count):
+    """count evenly spread pixel indices into size pixels, at pixel centers"""
+    return (2 * np.arange(count) + 1) * size // (2 * count)
+
+
+class RasterMazeRenderer:
+    """Draws the visible part of a maze with a few NumPy operations per frame.
+
+    The cells in view are sampled into the image described by raster_image
+    at no more than one image pixel per screen pixel. The image goes through
+    pygame.surfarray into an 8-bit palette surface, scaled up to the view's
+    size on screen when cells are more than a pixel wide.
+    """
+
+    def __init__(self):
+        self.cell_map = None
+        self.raster = None
+
+    def draw(
+        self,
+        surface,
+        cell_map,
+        search_map,
+        rows,
+        cols,
+        x_off,
+        y_off,
+        cell_size,
+        view=None,
+    ):
+        if self.cell_map is not cell_map:
+            # Wall pixels only change with the maze
+            masks = cell_map.masks()
+            self.cell_map = cell_map
+            self.open_right = (masks & RIGHT) != 0
+            self.open_down = (masks & BOTTOM) != 0
+
+        view = clamp_view(view, rows, cols)
+        # One more cell on each side so the passages at the view's edge show
+        row0 = max(0, view[0] - 1)
+        row1 = min(rows, view[1] + 1)
+        col0 = max(0, view[2] - 1)
+        col1 = min(cols, view[3] + 1)
+        state = np.frombuffer(search_map, dtype=np.uint8).reshape(rows, cols)
+        state = state[row0:row1, col0:col1]
+
+        image_h = 2 * (row1 - row0) + 1
+        image_w = 2 * (col1 - col0) + 1
+        width = max(1, round((col1 - col0) * cell_size))
+        height = max(1, round((row1 - row0) * cell_size))
+        # Sample straight down to the screen size instead of scaling later,
+        # at pixel centers: at two image pixels per screen pixel, sampling
+        # pixel starts would only ever hit walls
+        ys = sample_positions(image_h, min(height, image_h))
+        xs = sample_positions(image_w, min(width, image_w))
+        image = raster_image(
+            state,
+            self.open_right[row0:row1, col0:col1],
+            self.open_down[row0:row1, col0:col1],
+            ys,
+            xs,
+        )
+        for idx, color in ((0, RASTER_START), (cell_map.goal, RASTER_END)):
+            row, col = divmod(idx, cols)
+            if row0 <= row < row1 and col0 <= col < col1:
+                # Nearest sampled pixel, so the markers survive downsampling
+                y = np.searchsorted(ys, 2 * (row - row0) + 1)
+                x = np.searchsorted(xs, 2 * (col - col0) + 1)
+                image[min(y, len(ys) - 1), min(x, len(xs) - 1)] = color
+
+        # 8-bit surface with the palette attached, reused while the size holds
+        if self.raster is None or self.raster.get_size() != image.shape[::-1]:
+            self.raster = pygame.Surface(image.shape[::-1], depth=8)
+            self.raster.set_palette([tuple(color) for color in RASTER_PALETTE])
+        # surfarray images are indexed (x, y)
+        pygame.surfarray.blit_array(self.raster, image.T)
+        position = (x_off + int(col0 * cell_size), y_off + int(row0 * cell_size))
+        if self.raster.get_size() == (width, height):
+            surface.blit(self.raster, position)
+        else:
+            surface.blit(pygame.transform.scale(self.raster, (width, height)), position)
+
+
+MAZE_RENDERER = MazeRenderer()
+RASTER_RENDERER = RasterMazeRenderer()
 
 
 def draw_maze(
@@ -20,100 +411,103 @@ def draw_maze(
     x_off,
     y_off,
     cell_size,
-    y_scroll_offset=0,
+    renderer=None,
+    view=None,
 ):
-    # Calculate the bounds of visible area to avoid drawing cells that are off-screen
-    visible_top = max(0, (y_scroll_offset - y_off) // cell_size)
-    visible_bottom = min(rows, (y_scroll_offset + surface.get_height() - y_off) // cell_size + 1)
-    
-    # Draw border around the maze
-    border_width = 2
-    maze_rect = pygame.Rect(
-        x_off - border_width,
-        y_off - border_width,
-        cols * cell_size + border_width * 2,
-        rows * cell_size + border_width * 2
+    """Draw a maze and its search state.
+
+    x_off and y_off place the maze's top-left corner, which may be off
+    screen. view limits drawing to a (row0, row1, col0, col1) range of cells,
+    such as Camera.visible_cells(); by default the whole maze is drawn.
+    Uses the cached MazeRenderer, or the NumPy RasterMazeRenderer once cells
+    are smaller than RASTER_CELL_SIZE pixels, unless a renderer is given.
+    """
+    if renderer is None:
+        renderer = RASTER_RENDERER if cell_size < RASTER_CELL_SIZE else MAZE_RENDERER
+    renderer.draw(
+        surface, cell_map, search_map, rows, cols, x_off, y_off, cell_size, view
     )
-    pygame.draw.rect(surface, BLACK, maze_rect, width=border_width)
-    
-    # Only draw cells that are visible in the current view
-    for row in range(visible_top, visible_bottom):
-        for col in range(cols):
-            idx = row * cols + col
-            x = x_off + col * cell_size
-            y = y_off + row * cell_size
-            
-            # Choose cell color based on state
-            cell_color = WHITE  # Default cell color (unexplored)
-            
-            # Start cell
-            if idx == 0:
-                cell_color = (50, 205, 50)  # Bright green for start
-            # End cell
-            elif idx == rows * cols - 1:
-                cell_color = (220, 20, 60)  # Crimson for end
-            # Solution path cells (colored in red/light coral)
-            elif search_map[idx]["inSolution"]:
-                cell_color = LIGHT_CORAL
-            # Searched cells (colored in blue)
-            elif search_map[idx]["searched"]:
-                cell_color = CORN_FLOWER_BLUE
-            
-            # Draw cell background
-            pygame.draw.rect(surface, cell_color, (x, y, cell_size, cell_size))
-            
-            # Adjust wall thickness based on cell size
-            line_thickness = max(1, int(cell_size / 25))
-            
-            # Draw walls where there's no connection
-            # Left wall
-            if idx % cols != 0 and not cell_map[idx].left["connection"]:
-                pygame.draw.line(surface, BLACK, (x, y), (x, y + cell_size), line_thickness)
-            
-            # Right wall
-            if (idx + 1) % cols != 0 and not cell_map[idx].right["connection"]:
-                pygame.draw.line(
-                    surface, BLACK, (x + cell_size, y), (x + cell_size, y + cell_size), line_thickness
-                )
-            
-            # Top wall
-            if idx >= cols and not cell_map[idx].top["connection"]:
-                pygame.draw.line(surface, BLACK, (x, y), (x + cell_size, y), line_thickness)
-            
-            # Bottom wall
-            if idx < (rows * cols - cols) and not cell_map[idx].bottom["connection"]:
-                pygame.draw.line(
-                    surface, BLACK, (x, y + cell_size), (x + cell_size, y + cell_size), line_thickness
-                )
-            
-            # External walls (maze boundaries)
-            if idx % cols == 0:  # Leftmost column
-                pygame.draw.line(surface, BLACK, (x, y), (x, y + cell_size), line_thickness)
-            if (idx + 1) % cols == 0:  # Rightmost column
-                pygame.draw.line(
-                    surface, BLACK, (x + cell_size, y), (x + cell_size, y + cell_size), line_thickness
-                )
-            if idx < cols:  # Top row
-                pygame.draw.line(surface, BLACK, (x, y), (x + cell_size, y), line_thickness)
-            if idx >= (rows * cols - cols):  # Bottom row
-                pygame.draw.line(
-                    surface, BLACK, (x, y + cell_size), (x + cell_size, y + cell_size), line_thickness
-                )
-            
-            # Add visual markers for start and end cells
-            if idx == 0:  # Start cell
-                radius = max(3, cell_size // 6)
-                center_x = x + cell_size // 2
-                center_y = y + cell_size // 2
-                pygame.draw.circle(surface, BLACK, (center_x, center_y), radius)
-            elif idx == rows * cols - 1:  # End cell
-                margin = max(2, cell_size // 8)
-                pygame.draw.rect(
-                    surface,
-                    BLACK,
-                    (x + margin, y + margin, cell_size - 2 * margin, cell_size - 2 * margin),
-                    width=max(1, cell_size // 12)
-                )
+
+
+class SurfaceCache:
+    """LRU cache of pre-rendered decoration surfaces.
+
+    Keys describe a surface completely, such as its kind, size and colors,
+    so a resize or recolor makes a new entry instead of changing one. The
+    least recently used surfaces are dropped past max_entries.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """The surface for key, calling build() to render it when missing"""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = build()
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+DECORATIONS = SurfaceCache()
+TEXT_CACHE = SurfaceCache(max_entries=512)
+
+
+def render_text(font, text, antialias, color):
+    """font.render(text, antialias, color) through the shared text cache.
+
+    Surfaces are shared between callers, so they must only be blitted.
+    """
+    color = tuple(color)
+    return TEXT_CACHE.get(
+        ("text", font, text, color, antialias),
+        lambda: font.render(text, antialias, color),
+    )
+
+
+def gradient_strip(length, start, end):
+    """length colors blended linearly from start towards end, as uint8 RGB"""
+    ratio = (np.arange(length) / max(1, length))[:, None]
+    start = np.array(start, dtype=np.float64)
+    end = np.array(end, dtype=np.float64)
+    return (start * (1 - ratio) + end * ratio).astype(np.uint8)
+
+
+def vertical_gradient(size, top, bottom):
+    """Cached surface of the given size fading from top to bottom color"""
+
+    def build():
+        width, height = size
+        strip = gradient_strip(height, top, bottom)
+        # One pixel wide, then stretched: every row is a single color
+        column = pygame.surfarray.make_surface(strip[None, :, :])
+        return pygame.transform.scale(column, (width, height))
+
+    return DECORATIONS.get(("vertical", size, top, bottom), build)
+
+
+def bar_gradient(size, color):
+    """Cached bar surface brightening from color halfway to white"""
+
+    def build():
+        width, height = size
+        end = tuple(channel + (255 - channel) * 0.5 for channel in color)
+        row = pygame.surfarray.make_surface(gradient_strip(width, color, end)[:, None])
+        return pygame.transform.scale(row, (width, height))
+
+    return DECORATIONS.get(("bar", size, color), build)
 
 
 def draw_scrollbar(surface, content_height, visible_height, scroll_y):
@@ -162,7 +556,7 @@ def draw_button(surface, rect, text, font, is_hovered):
     pygame.draw.rect(surface, border_color, rect, width=1, border_radius=5)
     
     # Draw text
-    txt_surf = font.render(text, True, BLACK)
+    txt_surf = render_text(font, text, True, BLACK)
     surface.blit(
         txt_surf,
         (